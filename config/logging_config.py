@@ -8,6 +8,7 @@ import sys
 from typing import Any
 
 import structlog
+from opentelemetry import trace
 from structlog.types import EventDict, Processor
 
 from config.settings import settings
@@ -27,6 +28,16 @@ def add_timestamp(logger: Any, method_name: str, event_dict: EventDict) -> Event
     return event_dict
 
 
+def add_trace_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """Add current trace and span IDs to event dict if a span is recording."""
+    span = trace.get_current_span()
+    if span.is_recording():
+        span_context = span.get_span_context()
+        event_dict["trace_id"] = format(span_context.trace_id, "032x")
+        event_dict["span_id"] = format(span_context.span_id, "016x")
+    return event_dict
+
+
 def configure_logging() -> None:
     """Configure structlog for structured JSON logging."""
 
@@ -39,8 +50,11 @@ def configure_logging() -> None:
 
     # Processors for structlog
     processors: list[Processor] = [
+        # Drop filtered-out events before any other processor runs
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
+        add_trace_context,
         add_log_level,
         add_timestamp,
         structlog.processors.StackInfoRenderer(),
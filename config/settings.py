@@ -34,6 +34,17 @@ class Settings(BaseSettings):
     llm_temperature: float = Field(default=0.0, description="LLM temperature")
     llm_max_retries: int = Field(default=3, description="Maximum retries for LLM calls")
     llm_timeout_seconds: int = Field(default=30, description="LLM request timeout")
+    agent_pool_size: int = Field(
+        default=16,
+        description="Maximum concurrent executions per agent type",
+    )
+    llm_batching_enabled: bool = Field(
+        default=False,
+        description="Coalesce concurrent triage LLM calls into batched requests",
+    )
+    llm_batch_max_size: int = Field(default=8, description="Maximum requests per LLM batch")
+    llm_batch_window_ms: int = Field(default=10, description="Time to wait for an LLM batch to fill")
+    llm_batch_queue_size: int = Field(default=1000, description="Queued LLM requests before callers block")
 
     # Rate Limiting
     rate_limit_requests_per_minute: int = Field(
@@ -52,6 +63,70 @@ class Settings(BaseSettings):
         description="OpenTelemetry exporter type",
     )
     metrics_port: int = Field(default=9090, description="Prometheus metrics port")
+    tool_trace_sample_rate: float = Field(
+        default=0.1,
+        description="Fraction of database and knowledge base calls that get a span (0-1)",
+    )
+
+    # Caching
+    node_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse triage routing for repeat tickets",
+    )
+    node_cache_ttl_seconds: int = Field(default=900, description="Node cache entry lifetime")
+    node_cache_max_size: int = Field(default=10000, description="Maximum node cache entries")
+    semantic_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse triage routing for semantically similar tickets",
+    )
+    semantic_cache_model: str = Field(
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        description="Embedding model for the semantic routing cache",
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.92,
+        description="Minimum cosine similarity for a semantic cache hit",
+    )
+    semantic_cache_path: str = Field(
+        default="",
+        description="File to persist the semantic routing cache to (empty disables)",
+    )
+
+    # Speculative routing
+    speculative_routing_enabled: bool = Field(
+        default=False,
+        description="Start a side-effect-free alternate specialist alongside the primary on low-confidence routing",
+    )
+    speculative_routing_threshold: float = Field(
+        default=0.7,
+        description="Routing confidence below which the alternate specialist runs speculatively",
+    )
+    speculative_routing_max_concurrency: int = Field(
+        default=16,
+        description="Maximum tickets dispatched speculatively at once",
+    )
+
+    # Tools
+    tool_http_timeout_seconds: float = Field(
+        default=10.0,
+        description="Timeout for outbound tool HTTP requests",
+    )
+    tool_http_max_connections: int = Field(
+        default=100,
+        description="Maximum connections in the shared tool HTTP pool",
+    )
+    tool_http_max_keepalive_connections: int = Field(
+        default=50,
+        description="Idle connections kept alive in the shared tool HTTP pool",
+    )
+    payment_query_cache_ttl_seconds: int = Field(
+        default=30,
+        description="Lifetime of cached payment status lookups",
+    )
+    payment_query_cache_max_size: int = Field(
+        default=10000,
+        description="Maximum cached payment status lookups",
+    )
 
     # Mock Mode
     use_mock_tools: bool = Field(default=True, description="Use mock tools for testing")
@@ -14,17 +14,9 @@ from datetime import datetime
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tests.evaluation.test_routing_eval import (
-    test_billing_routing,
-    test_technical_routing,
-    test_account_routing,
-    test_edge_case_routing,
-)
-from tests.evaluation.test_tool_usage_eval import (
-    test_billing_tool_usage,
-    test_technical_tool_usage,
-    test_account_tool_usage,
-)
+from tests.evaluation.common import reset_eval_state, run_eval_suite
+from tests.evaluation.test_routing_eval import ROUTING_METRIC, EDGE_CASE_ROUTING_METRIC
+from tests.evaluation.test_tool_usage_eval import TOOL_USAGE_METRIC
 from tests.evaluation.test_benchmark import benchmark_category, dataset_file_to_category, calculate_statistics
 
 
@@ -43,16 +35,34 @@ async def run_all_evaluations():
         "summary": {},
     }
 
-    # ===== ROUTING EVALUATION =====
+    # ===== ROUTING AND TOOL USAGE EVALUATION =====
+    # Each ticket runs through the workflow once; its final state feeds both
+    # the routing and the tool usage metric
     print("\n" + "#"*60)
-    print("#  PART 1: ROUTING ACCURACY EVALUATION")
+    print("#  PART 1: ROUTING ACCURACY AND TOOL USAGE CORRECTNESS EVALUATION")
     print("#"*60)
 
     try:
-        billing_routing = await test_billing_routing()
-        technical_routing = await test_technical_routing()
-        account_routing = await test_account_routing()
-        edge_routing = await test_edge_case_routing()
+        # Start from fresh workflow runs
+        reset_eval_state()
+
+        billing_routing, billing_tools = await run_eval_suite(
+            ["billing_cases.json"],
+            [ROUTING_METRIC, TOOL_USAGE_METRIC],
+        )
+        technical_routing, technical_tools = await run_eval_suite(
+            ["technical_cases.json"],
+            [ROUTING_METRIC, TOOL_USAGE_METRIC],
+        )
+        account_routing, account_tools = await run_eval_suite(
+            ["account_cases.json"],
+            [ROUTING_METRIC, TOOL_USAGE_METRIC],
+        )
+        # Edge cases don't all have expected_tools, so only routing is scored
+        [edge_routing] = await run_eval_suite(
+            ["edge_cases.json"],
+            [EDGE_CASE_ROUTING_METRIC],
+        )
 
         results["routing"] = {
             "billing": {
@@ -89,20 +99,6 @@ async def run_all_evaluations():
         ])
         results["summary"]["routing_passed"] = routing_passed
 
-    except Exception as e:
-        print(f"❌ Routing evaluation failed: {e}")
-        results["summary"]["routing_passed"] = False
-
-    # ===== TOOL USAGE EVALUATION =====
-    print("\n" + "#"*60)
-    print("#  PART 2: TOOL USAGE CORRECTNESS EVALUATION")
-    print("#"*60)
-
-    try:
-        billing_tools = await test_billing_tool_usage()
-        technical_tools = await test_technical_tool_usage()
-        account_tools = await test_account_tool_usage()
-
         results["tool_usage"] = {
             "billing": {
                 "correctness": billing_tools["correctness"],
@@ -129,12 +125,13 @@ async def run_all_evaluations():
         results["summary"]["tool_usage_passed"] = tool_usage_passed
 
     except Exception as e:
-        print(f"❌ Tool usage evaluation failed: {e}")
+        print(f"❌ Routing and tool usage evaluation failed: {e}")
+        results["summary"]["routing_passed"] = False
         results["summary"]["tool_usage_passed"] = False
 
     # ===== PERFORMANCE BENCHMARKS =====
     print("\n" + "#"*60)
-    print("#  PART 3: PERFORMANCE BENCHMARKS")
+    print("#  PART 2: PERFORMANCE BENCHMARKS")
     print("#"*60)
 
     try:
@@ -147,17 +144,20 @@ async def run_all_evaluations():
         # Calculate overall performance
         all_durations = []
         total_tickets = 0
+        total_failed = 0
         total_cost = 0
 
         for result in benchmark_results:
-            all_durations.extend([r["duration_ms"] for r in result["results"]])
+            all_durations.extend(result["durations_ms"])
             total_tickets += result["num_tests"]
+            total_failed += result["num_failed"]
             total_cost += result["total_cost"]
 
         overall_stats = calculate_statistics(all_durations)
 
         results["performance"] = {
             "total_tickets": total_tickets,
+            "failed_tickets": total_failed,
             "latency_ms": {
                 "mean": overall_stats["mean"],
                 "median": overall_stats["median"],
@@ -172,7 +172,8 @@ async def run_all_evaluations():
         p95_passed = overall_stats["p95"] < 3000  # 3 seconds
         cost_passed = (total_cost / total_tickets) < 0.01 if total_tickets > 0 else False  # $0.01
 
-        results["summary"]["performance_passed"] = p95_passed and cost_passed
+        # Failed tickets are missing from the latency and cost figures
+        results["summary"]["performance_passed"] = total_failed == 0 and p95_passed and cost_passed
 
     except Exception as e:
         print(f"❌ Performance benchmarks failed: {e}")
@@ -196,6 +197,7 @@ async def run_all_evaluations():
     print(f"\nPerformance:")
     perf = results["performance"]
     print(f"  Total Tickets: {perf['total_tickets']}")
+    print(f"  Failed Tickets: {perf['failed_tickets']} {'✅' if perf['failed_tickets'] == 0 else '❌'}")
     print(f"  Latency P95: {perf['latency_ms']['p95']:.0f}ms {'✅' if perf['latency_ms']['p95'] < 3000 else '❌'}")
     print(f"  Latency P99: {perf['latency_ms']['p99']:.0f}ms")
     print(f"  Avg Cost: ${perf['avg_cost_per_ticket']:.4f} {'✅' if perf['avg_cost_per_ticket'] < 0.01 else '❌'}")
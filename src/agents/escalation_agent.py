@@ -2,6 +2,7 @@
 Escalation Agent - Handles complex issues and determines human escalation.
 """
 
+import asyncio
 from typing import Dict, Any
 
 from src.agents.base import BaseAgent
@@ -44,16 +45,37 @@ class EscalationAgent(BaseAgent):
         # Gather comprehensive context
         tool_calls = []
 
-        # Get customer info
+        # Customer info, ticket history and KB search are independent, so
+        # issue them together
         customer_info = None
         db_tool = self.tool_registry.get("database_query")
+        kb_tool = self.tool_registry.get("knowledge_base")
+
+        lookups = []
         if db_tool and customer_id:
-            result = await db_tool.execute(
+            lookups.append(db_tool.multi_query([
                 DatabaseQueryInput(
                     query_type="customer_info",
                     customer_id=customer_id,
+                ),
+                DatabaseQueryInput(
+                    query_type="ticket_history",
+                    customer_id=customer_id,
+                    limit=10,
+                ),
+            ]))
+        if kb_tool:
+            lookups.append(kb_tool.execute(
+                KnowledgeBaseInput(
+                    query=subject,
+                    category="all",
+                    max_results=5,
                 )
-            )
+            ))
+        results = list(await asyncio.gather(*lookups))
+
+        if db_tool and customer_id:
+            result, history_result = results.pop(0)
             if result.success:
                 customer_info = result.result
                 tool_calls.append({
@@ -61,15 +83,6 @@ class EscalationAgent(BaseAgent):
                     "input": {"query_type": "customer_info"},
                     "output": customer_info,
                 })
-
-            # Get ticket history
-            history_result = await db_tool.execute(
-                DatabaseQueryInput(
-                    query_type="ticket_history",
-                    customer_id=customer_id,
-                    limit=10,
-                )
-            )
             if history_result.success:
                 tool_calls.append({
                     "tool": "database_query",
@@ -77,16 +90,8 @@ class EscalationAgent(BaseAgent):
                     "output": history_result.result,
                 })
 
-        # Search knowledge base for any relevant info
-        kb_tool = self.tool_registry.get("knowledge_base")
         if kb_tool:
-            result = await kb_tool.execute(
-                KnowledgeBaseInput(
-                    query=subject,
-                    category="all",
-                    max_results=5,
-                )
-            )
+            result = results.pop(0)
             if result.success:
                 tool_calls.append({
                     "tool": "knowledge_base",
@@ -33,6 +33,7 @@ You must respond in this exact format:
 ROUTE: [agent_name]
 URGENCY: [urgency_level]
 CONFIDENCE: [0.0-1.0]
+ALTERNATE: [second most likely agent_name, only if CONFIDENCE is below 0.7]
 REASONING: [brief explanation]
 
 ## Examples:
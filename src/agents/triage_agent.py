@@ -5,12 +5,23 @@ Triage Agent - Routes incoming tickets to appropriate specialist agents.
 import re
 from typing import Dict, Any
 
+from config.settings import settings
 from src.agents.base import BaseAgent
 from src.agents.prompts.triage import TRIAGE_AGENT_PROMPT
+from src.llm.batcher import get_llm_batcher
 from src.llm.client import get_llm_client
 from src.observability.decorators import trace_agent
 from src.tools.registry import get_tool_registry
 
+# Routing response fields, e.g.
+# "ROUTE: billing_agent | URGENCY: medium | CONFIDENCE: 0.92 | REASONING: ..."
+# Each field is matched on its own so missing or reordered fields still parse.
+_ROUTE_RE = re.compile(r"ROUTE:\s*(\w+)", re.IGNORECASE)
+_URGENCY_RE = re.compile(r"URGENCY:\s*(\w+)", re.IGNORECASE)
+_CONFIDENCE_RE = re.compile(r"CONFIDENCE:\s*([\d.]+)", re.IGNORECASE)
+_ALTERNATE_RE = re.compile(r"ALTERNATE:\s*(\w+)", re.IGNORECASE)
+_REASONING_RE = re.compile(r"REASONING:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+
 
 class TriageAgent(BaseAgent):
     """
@@ -68,11 +79,14 @@ Customer Context:
 Analyze this ticket and provide your routing decision."""
 
         # Get LLM decision
-        response = await self.llm_client.generate(
-            system=TRIAGE_AGENT_PROMPT,
-            user_message=user_message,
-            agent_name="triage",
-        )
+        if settings.llm_batching_enabled:
+            response = await get_llm_batcher("triage").submit(TRIAGE_AGENT_PROMPT, user_message)
+        else:
+            response = await self.llm_client.generate(
+                system=TRIAGE_AGENT_PROMPT,
+                user_message=user_message,
+                agent_name="triage",
+            )
 
         # Parse response
         routing_decision = self._parse_routing_response(response.content)
@@ -128,13 +142,15 @@ Analyze this ticket and provide your routing decision."""
             "urgency": "medium",
             "confidence_score": 0.5,
             "reasoning": "Could not parse routing decision",
+            "alternate_agent": "",
         }
 
         # Parse using regex
-        route_match = re.search(r"ROUTE:\s*(\w+)", response, re.IGNORECASE)
-        urgency_match = re.search(r"URGENCY:\s*(\w+)", response, re.IGNORECASE)
-        confidence_match = re.search(r"CONFIDENCE:\s*([\d.]+)", response, re.IGNORECASE)
-        reasoning_match = re.search(r"REASONING:\s*(.+?)(?:\n|$)", response, re.IGNORECASE)
+        route_match = _ROUTE_RE.search(response)
+        urgency_match = _URGENCY_RE.search(response)
+        confidence_match = _CONFIDENCE_RE.search(response)
+        alternate_match = _ALTERNATE_RE.search(response)
+        reasoning_match = _REASONING_RE.search(response)
 
         if route_match:
             routing["assigned_agent"] = route_match.group(1).strip()
@@ -148,6 +164,11 @@ Analyze this ticket and provide your routing decision."""
             except ValueError:
                 pass
 
+        if alternate_match:
+            alternate = alternate_match.group(1).strip()
+            if alternate != routing["assigned_agent"]:
+                routing["alternate_agent"] = alternate
+
         if reasoning_match:
             routing["reasoning"] = reasoning_match.group(1).strip()
 
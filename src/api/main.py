@@ -14,6 +14,10 @@ from src.api.routes import health, metrics, tickets
 from src.api.middleware.correlation_id import CorrelationIdMiddleware
 from src.api.middleware.error_handler import error_handler_middleware
 
+from src.llm.batcher import close_llm_batchers
+from src.orchestration.graph import warmup_workflow
+from src.orchestration.semantic_cache import save_semantic_cache
+from src.tools.registry import close_tool_registry, get_tool_registry
 from src.observability.logger import get_logger
 
 # Configure observability before creating the app
@@ -59,6 +63,8 @@ app.include_router(tickets.router)
 @app.on_event("startup")
 async def startup_event():
     """Application startup event."""
+    await get_tool_registry().ensure_initialized()
+    await warmup_workflow()
     logger.info(
         "application_started",
         environment=settings.app_env,
@@ -69,6 +75,9 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event."""
+    save_semantic_cache()
+    await close_tool_registry()
+    await close_llm_batchers()
     logger.info("application_shutdown")
 
 
@@ -7,7 +7,12 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.responses import Response
 import structlog
 
-from src.observability.context import generate_correlation_id, set_correlation_id, get_correlation_id
+from src.observability.context import (
+    generate_correlation_id,
+    get_correlation_id,
+    reset_correlation_id,
+    set_correlation_id,
+)
 
 
 class CorrelationIdMiddleware(BaseHTTPMiddleware):
@@ -32,18 +37,20 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
             correlation_id = generate_correlation_id()
 
         # Set in context for the request
-        set_correlation_id(correlation_id)
+        token = set_correlation_id(correlation_id)
 
         # Bind to structlog context
         structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
 
-        # Process request
-        response = await call_next(request)
+        try:
+            # Process request
+            response = await call_next(request)
 
-        # Add correlation ID to response headers
-        response.headers["X-Correlation-ID"] = correlation_id
-
-        # Clear context after request
-        structlog.contextvars.clear_contextvars()
+            # Add correlation ID to response headers
+            response.headers["X-Correlation-ID"] = correlation_id
+        finally:
+            # Clear context after request
+            structlog.contextvars.clear_contextvars()
+            reset_correlation_id(token)
 
         return response
@@ -0,0 +1,191 @@
+"""
+Micro-batching of LLM requests across concurrent tickets.
+
+Requests submitted within a short window are coalesced into a single
+provider call, amortizing per-request overhead under load.
+"""
+
+import asyncio
+import functools
+from typing import List, Optional, Tuple
+
+from config.settings import settings
+from src.llm.client import LLMClient, LLMResponse, get_llm_client
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (system, user_message, future for the response)
+_BatchItem = Tuple[str, str, "asyncio.Future[LLMResponse]"]
+
+
+def _cancel_unresolved(batch: List[_BatchItem], task: asyncio.Task) -> None:
+    """Cancel the futures a dispatch task left unresolved (it was cancelled)."""
+    for _, _, future in batch:
+        future.cancel()
+
+
+class LLMBatcher:
+    """
+    Coalesces concurrent generate requests into batched provider calls.
+
+    A background worker collects queued requests until ``max_batch_size``
+    is reached or ``max_wait`` seconds pass since the first one, then sends
+    them as one batch and resolves each caller's future.
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        agent_name: Optional[str] = None,
+        max_batch_size: int = 8,
+        max_wait: float = 0.01,
+        max_queue_size: int = 1000,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            llm_client: Client used to send batches
+            agent_name: Agent name for metrics
+            max_batch_size: Maximum requests per batch
+            max_wait: Seconds to wait for a batch to fill
+            max_queue_size: Queued requests before submit() blocks
+        """
+        self.llm_client = llm_client
+        self.agent_name = agent_name
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue_size = max_queue_size
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[_BatchItem]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: set = set()
+
+    def _ensure_worker(self) -> None:
+        """Start the worker for the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = loop.create_task(self._run())
+
+    async def submit(self, system: str, user_message: str) -> LLMResponse:
+        """
+        Queue a request and wait for its response.
+
+        Blocks while the queue is full, applying backpressure to callers.
+
+        Args:
+            system: System prompt
+            user_message: User message
+
+        Returns:
+            LLM response for this request
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((system, user_message, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without blocking collection of the next batch
+            task = loop.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            task.add_done_callback(functools.partial(_cancel_unresolved, batch))
+
+    async def _dispatch(self, batch: List[_BatchItem]) -> None:
+        """Send one batch and resolve its futures."""
+        try:
+            responses = await self.llm_client.generate_batch(
+                [{"system": system, "user_message": user_message} for system, user_message, _ in batch],
+                agent_name=self.agent_name,
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+        # A short response list must not leave callers waiting forever
+        if len(responses) < len(batch):
+            error = RuntimeError(
+                f"LLM batch returned {len(responses)} responses for {len(batch)} requests"
+            )
+            for _, _, future in batch[len(responses):]:
+                if not future.done():
+                    future.set_exception(error)
+
+    async def close(self) -> None:
+        """Stop the worker and cancel in-flight batches and queued requests."""
+        tasks = list(self._in_flight)
+        if self._worker is not None:
+            tasks.append(self._worker)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Requests still queued were never picked up by the worker
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                future.cancel()
+
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+
+# Global batcher instances, one per agent
+_batchers: dict[str, LLMBatcher] = {}
+
+
+def get_llm_batcher(agent_name: str) -> LLMBatcher:
+    """
+    Get the global batcher for an agent.
+
+    Args:
+        agent_name: Agent name
+
+    Returns:
+        LLMBatcher instance
+    """
+    batcher = _batchers.get(agent_name)
+    if batcher is None:
+        batcher = _batchers[agent_name] = LLMBatcher(
+            get_llm_client(),
+            agent_name=agent_name,
+            max_batch_size=settings.llm_batch_max_size,
+            max_wait=settings.llm_batch_window_ms / 1000,
+            max_queue_size=settings.llm_batch_queue_size,
+        )
+    return batcher
+
+
+async def close_llm_batchers() -> None:
+    """Stop all global batchers."""
+    for batcher in _batchers.values():
+        await batcher.close()
@@ -11,7 +11,7 @@ from datetime import datetime
 
 from config.settings import settings
 from src.llm.retry import retry_on_llm_error
-from src.llm.token_counter import estimate_tokens, TokenUsageTracker
+from src.llm.token_counter import estimate_tokens, PrefixTokenCache, TokenUsageTracker
 from src.observability.logger import get_logger
 from src.observability.tracer import trace_span, add_span_attributes
 from src.observability.metrics import record_llm_usage
@@ -63,6 +63,8 @@ class MockAnthropicClient:
     def __init__(self, api_key: str, model: str):
         self.api_key = api_key
         self.model = model
+        # System prompts are shared across calls, so cache their token counts
+        self._prefix_cache = PrefixTokenCache()
         logger.info("mock_llm_initialized", model=model)
 
     async def generate(
@@ -87,6 +89,32 @@ class MockAnthropicClient:
         # Simulate API call delay
         await asyncio.sleep(0.1)
 
+        return self._build_response(system, messages)
+
+    async def batch_generate(
+        self,
+        requests: List[Dict[str, Any]],
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+    ) -> List[LLMResponse]:
+        """
+        Generate responses for several requests in one call (mocked).
+
+        Args:
+            requests: Requests, each with "system" and "messages"
+            max_tokens: Maximum tokens to generate per request
+            temperature: Sampling temperature
+
+        Returns:
+            LLM responses, in request order
+        """
+        # One simulated round trip for the whole batch
+        await asyncio.sleep(0.1)
+
+        return [self._build_response(r["system"], r["messages"]) for r in requests]
+
+    def _build_response(self, system: str, messages: List[Dict[str, str]]) -> LLMResponse:
+        """Build the mock response and token counts for one request."""
         # Get last user message
         user_message = ""
         for msg in reversed(messages):
@@ -98,9 +126,9 @@ class MockAnthropicClient:
         mock_response = self._generate_mock_response(user_message, system)
 
         # Estimate tokens
-        prompt_text = system + " " + " ".join([m["content"] for m in messages])
-        prompt_tokens = estimate_tokens(prompt_text)
-        completion_tokens = estimate_tokens(mock_response)
+        prompt_text = "\n\n".join([system] + [m["content"] for m in messages])
+        prompt_tokens = self._prefix_cache.count(prompt_text, self.model)
+        completion_tokens = estimate_tokens(mock_response, self.model)
 
         logger.info(
             "mock_llm_generated",
@@ -335,20 +363,7 @@ class LLMClient:
                     temperature=self.temperature,
                 )
 
-                # Track usage
-                usage = self.usage_tracker.track(
-                    response.prompt_tokens,
-                    response.completion_tokens,
-                    self.model,
-                )
-
-                # Record metrics
-                record_llm_usage(
-                    model=self.model,
-                    prompt_tokens=response.prompt_tokens,
-                    completion_tokens=response.completion_tokens,
-                    agent=agent_name,
-                )
+                usage = self._record_usage(response, agent_name)
 
                 # Add to span
                 add_span_attributes(
@@ -379,6 +394,82 @@ class LLMClient:
                 )
                 raise LLMError(f"LLM generation failed: {str(e)}") from e
 
+    @retry_on_llm_error
+    async def generate_batch(
+        self,
+        requests: List[Dict[str, str]],
+        agent_name: Optional[str] = None,
+    ) -> List[LLMResponse]:
+        """
+        Generate responses for several prompts in one provider call.
+
+        Args:
+            requests: Requests, each with "system" and "user_message"
+            agent_name: Optional agent name for metrics
+
+        Returns:
+            LLM responses, in request order
+
+        Raises:
+            LLMError: On API errors
+        """
+        with trace_span(
+            "llm.generate_batch",
+            {"llm.model": self.model, "agent": agent_name or "unknown", "llm.batch_size": len(requests)},
+        ):
+            try:
+                responses = await self.client.batch_generate(
+                    [
+                        {
+                            "system": r["system"],
+                            "messages": [{"role": "user", "content": r["user_message"]}],
+                        }
+                        for r in requests
+                    ],
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                )
+
+                for response in responses:
+                    self._record_usage(response, agent_name)
+
+                logger.info(
+                    "llm_batch_completed",
+                    model=self.model,
+                    agent=agent_name,
+                    batch_size=len(requests),
+                )
+
+                return responses
+
+            except Exception as e:
+                logger.error(
+                    "llm_batch_failed",
+                    model=self.model,
+                    agent=agent_name,
+                    batch_size=len(requests),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                raise LLMError(f"LLM batch generation failed: {str(e)}") from e
+
+    def _record_usage(self, response: LLMResponse, agent_name: Optional[str]) -> Dict[str, Any]:
+        """Track token usage and record LLM metrics for a response."""
+        usage = self.usage_tracker.track(
+            response.prompt_tokens,
+            response.completion_tokens,
+            self.model,
+        )
+
+        record_llm_usage(
+            model=self.model,
+            prompt_tokens=response.prompt_tokens,
+            completion_tokens=response.completion_tokens,
+            agent=agent_name,
+        )
+
+        return usage
+
     def get_usage_summary(self) -> Dict[str, float]:
         """
         Get summary of token usage and costs.
@@ -2,24 +2,148 @@
 Token counting utilities for cost estimation.
 """
 
-from typing import Dict
+import functools
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
 
-def estimate_tokens(text: str) -> int:
+DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+
+# Fallback encoding for models tiktoken doesn't know about (e.g. Claude)
+DEFAULT_ENCODING = "cl100k_base"
+
+
+@functools.lru_cache(maxsize=4)
+def get_encoder(model: str = DEFAULT_MODEL) -> Optional[Any]:
+    """
+    Get a cached tiktoken encoder for a model.
+
+    Args:
+        model: Model identifier
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken is not installed
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+# Token counts by (model, text digest). Keyed on a digest rather than the
+# text, so the cache holds 16-byte keys instead of whole prompts.
+_TOKEN_COUNT_CACHE_SIZE = 10_000
+_token_counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+
+
+def _count_tokens(model: str, text: str) -> int:
+    """Count tokens with the model's encoder (memoized on model and text digest)."""
+    key = (model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+    count = _token_counts.get(key)
+    if count is not None:
+        _token_counts.move_to_end(key)
+        return count
+
+    count = len(get_encoder(model).encode(text))
+    _token_counts[key] = count
+    if len(_token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+        _token_counts.popitem(last=False)
+    return count
+
+
+def estimate_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
     """
     Estimate token count for a text string.
 
-    This is a rough approximation. For production, use proper tokenizer.
-    Rule of thumb: ~4 characters per token for English text.
+    Uses tiktoken when installed, which is much closer to real token counts.
+    Otherwise falls back to the rule of thumb of ~4 characters per token
+    for English text.
 
     Args:
         text: Input text
+        model: Model identifier used to select the encoding
 
     Returns:
         Estimated token count
     """
-    # Simple estimation: 4 characters per token
-    return max(1, len(text) // 4)
+    if tiktoken is None:
+        # Simple estimation: 4 characters per token
+        return max(1, len(text) // 4)
+    return max(1, _count_tokens(model, text))
+
+
+class PrefixTokenCache:
+    """
+    Token counts for shared prompt prefixes, cached at message boundaries.
+
+    Prompts built from a system prompt plus conversation turns share a long
+    prefix between calls. Counts are cached for every boundary-delimited
+    prefix, so a new prompt only tokenizes the segments after the longest
+    prefix already seen. Segment counts are summed, which can differ by a
+    token or two per boundary from tokenizing the whole text at once.
+    """
+
+    def __init__(self, boundary: str = "\n\n", maxsize: int = 100_000):
+        """
+        Initialize prefix cache.
+
+        Args:
+            boundary: Separator between messages in the prompt text
+            maxsize: Maximum number of cached prefixes (LRU eviction)
+        """
+        self.boundary = boundary
+        self.maxsize = maxsize
+        self._counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+
+    def count(self, text: str, model: str = DEFAULT_MODEL) -> int:
+        """
+        Count tokens in text, reusing the longest cached prefix.
+
+        Args:
+            text: Full prompt text
+            model: Model identifier used to select the encoding
+
+        Returns:
+            Estimated token count
+        """
+        total = 0
+        prefix_hash = hashlib.blake2b(digest_size=16)
+        cached = True
+
+        for index, segment in enumerate(text.split(self.boundary)):
+            # Hash the prefix incrementally so each key identifies all of it;
+            # length framing keeps segment boundaries unambiguous
+            data = segment.encode("utf-8")
+            prefix_hash.update(len(data).to_bytes(8, "little"))
+            prefix_hash.update(data)
+            key = (model, prefix_hash.digest())
+
+            if cached and key in self._counts:
+                self._counts.move_to_end(key)
+                total = self._counts[key]
+                continue
+
+            cached = False
+            if index > 0:
+                segment = self.boundary + segment
+            total += estimate_tokens(segment, model)
+
+            self._counts[key] = total
+            if len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+
+        return total
+
+    def clear(self) -> None:
+        """Clear all cached prefixes."""
+        self._counts.clear()
 
 
 def calculate_cost(
@@ -3,7 +3,7 @@ Context management for correlation IDs and request tracking.
 """
 
 import uuid
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from typing import Optional
 
 # Context variable for correlation ID
@@ -20,14 +20,30 @@ def generate_correlation_id() -> str:
     return f"CID-{uuid.uuid4().hex[:16]}"
 
 
-def set_correlation_id(correlation_id: str) -> None:
+def set_correlation_id(correlation_id: str) -> Token:
     """
     Set the correlation ID for the current context.
 
+    The value is local to the current asyncio task (and tasks it creates),
+    so concurrent tickets don't see each other's IDs.
+
     Args:
         correlation_id: Correlation ID to set
+
+    Returns:
+        Token for restoring the previous value with reset_correlation_id()
+    """
+    return correlation_id_var.set(correlation_id)
+
+
+def reset_correlation_id(token: Token) -> None:
+    """
+    Restore the correlation ID that was current before set_correlation_id().
+
+    Args:
+        token: Token returned by set_correlation_id()
     """
-    correlation_id_var.set(correlation_id)
+    correlation_id_var.reset(token)
 
 
 def get_correlation_id() -> Optional[str]:
@@ -3,8 +3,10 @@ Decorators for automatic observability instrumentation.
 """
 
 import time
+import random
 import functools
 import inspect
+from contextlib import nullcontext
 from typing import Any, Callable, TypeVar, cast
 
 from src.observability.tracer import trace_span, add_span_attributes
@@ -12,14 +14,34 @@ from src.observability.logger import get_logger
 from src.observability.metrics import (
     record_agent_invocation,
     record_agent_error,
-    record_tool_call,
     record_tool_error,
+    ToolCallRecorder,
 )
 
 F = TypeVar("F", bound=Callable[..., Any])
 
 logger = get_logger(__name__)
 
+_MISSING = object()
+
+
+def _add_decision_attributes(result: Any) -> None:
+    """Add confidence/reasoning from a dict agent result to the current span."""
+    if type(result) is not dict and not isinstance(result, dict):
+        return
+
+    confidence = result.get("confidence", _MISSING)
+    reasoning = result.get("reasoning", _MISSING)
+    if confidence is _MISSING and reasoning is _MISSING:
+        return
+
+    attrs: dict[str, Any] = {}
+    if confidence is not _MISSING:
+        attrs["confidence"] = confidence
+    if reasoning is not _MISSING:
+        attrs["reasoning"] = reasoning
+    add_span_attributes(**attrs)
+
 
 def trace_agent(agent_name: str) -> Callable[[F], F]:
     """
@@ -40,7 +62,7 @@ def trace_agent(agent_name: str) -> Callable[[F], F]:
     def decorator(func: F) -> F:
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             success = False
 
             with trace_span(f"agent.{agent_name}", {"agent.name": agent_name}):
@@ -54,13 +76,9 @@ def trace_agent(agent_name: str) -> Callable[[F], F]:
                     success = True
 
                     # Extract metadata if result is a dict with decision info
-                    if isinstance(result, dict):
-                        if "confidence" in result:
-                            add_span_attributes(confidence=result["confidence"])
-                        if "reasoning" in result:
-                            add_span_attributes(reasoning=result["reasoning"])
+                    _add_decision_attributes(result)
 
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     logger.info(
                         "agent_completed",
                         agent=agent_name,
@@ -71,7 +89,7 @@ def trace_agent(agent_name: str) -> Callable[[F], F]:
                     return result
 
                 except Exception as e:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     error_type = type(e).__name__
 
                     logger.error(
@@ -90,7 +108,7 @@ def trace_agent(agent_name: str) -> Callable[[F], F]:
 
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             success = False
 
             with trace_span(f"agent.{agent_name}", {"agent.name": agent_name}):
@@ -103,13 +121,9 @@ def trace_agent(agent_name: str) -> Callable[[F], F]:
                     result = func(*args, **kwargs)
                     success = True
 
-                    if isinstance(result, dict):
-                        if "confidence" in result:
-                            add_span_attributes(confidence=result["confidence"])
-                        if "reasoning" in result:
-                            add_span_attributes(reasoning=result["reasoning"])
+                    _add_decision_attributes(result)
 
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     logger.info(
                         "agent_completed",
                         agent=agent_name,
@@ -120,7 +134,7 @@ def trace_agent(agent_name: str) -> Callable[[F], F]:
                     return result
 
                 except Exception as e:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     error_type = type(e).__name__
 
                     logger.error(
@@ -146,12 +160,14 @@ def trace_agent(agent_name: str) -> Callable[[F], F]:
     return decorator
 
 
-def trace_tool(tool_name: str) -> Callable[[F], F]:
+def trace_tool(tool_name: str, sample: float = 1.0) -> Callable[[F], F]:
     """
     Decorator to automatically trace tool execution with observability.
 
     Args:
         tool_name: Name of the tool
+        sample: Fraction of calls to create a span for (0-1). Logs and
+            metrics are always recorded; only span creation is skipped.
 
     Returns:
         Decorated function
@@ -163,15 +179,25 @@ def trace_tool(tool_name: str) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
+        # Bind metric label children once at decoration time
+        recorder = ToolCallRecorder(tool_name)
+        span_name = f"tool.{tool_name}"
+        span_attributes = {"tool.name": tool_name}
+
+        def tool_span() -> Any:
+            if sample < 1.0 and random.random() >= sample:
+                return nullcontext()
+            return trace_span(span_name, span_attributes)
+
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             success = False
 
-            with trace_span(f"tool.{tool_name}", {"tool.name": tool_name}):
+            with tool_span() as span:
                 try:
                     # Log input if provided
-                    if args and len(args) > 1:
+                    if span is not None and args and len(args) > 1:
                         add_span_attributes(tool_input=str(args[1]))
 
                     logger.info(
@@ -181,7 +207,7 @@ def trace_tool(tool_name: str) -> Callable[[F], F]:
 
                     result = await func(*args, **kwargs)
                     success = True
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
 
                     logger.info(
                         "tool_completed",
@@ -190,11 +216,11 @@ def trace_tool(tool_name: str) -> Callable[[F], F]:
                         success=True,
                     )
 
-                    record_tool_call(tool_name, success, duration)
+                    recorder.record(success, duration)
                     return result
 
                 except Exception as e:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     error_type = type(e).__name__
 
                     logger.error(
@@ -205,18 +231,18 @@ def trace_tool(tool_name: str) -> Callable[[F], F]:
                         duration_seconds=duration,
                     )
 
-                    record_tool_call(tool_name, success, duration)
+                    recorder.record(success, duration)
                     record_tool_error(tool_name, error_type)
                     raise
 
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             success = False
 
-            with trace_span(f"tool.{tool_name}", {"tool.name": tool_name}):
+            with tool_span() as span:
                 try:
-                    if args and len(args) > 1:
+                    if span is not None and args and len(args) > 1:
                         add_span_attributes(tool_input=str(args[1]))
 
                     logger.info(
@@ -226,7 +252,7 @@ def trace_tool(tool_name: str) -> Callable[[F], F]:
 
                     result = func(*args, **kwargs)
                     success = True
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
 
                     logger.info(
                         "tool_completed",
@@ -235,11 +261,11 @@ def trace_tool(tool_name: str) -> Callable[[F], F]:
                         success=True,
                     )
 
-                    record_tool_call(tool_name, success, duration)
+                    recorder.record(success, duration)
                     return result
 
                 except Exception as e:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     error_type = type(e).__name__
 
                     logger.error(
@@ -250,7 +276,7 @@ def trace_tool(tool_name: str) -> Callable[[F], F]:
                         duration_seconds=duration,
                     )
 
-                    record_tool_call(tool_name, success, duration)
+                    recorder.record(success, duration)
                     record_tool_error(tool_name, error_type)
                     raise
 
@@ -118,6 +118,28 @@ def record_tool_call(tool: str, success: bool, duration: float) -> None:
     tool_call_duration.labels(tool=tool).observe(duration)
 
 
+class ToolCallRecorder:
+    """
+    Records tool call metrics with label children bound once per tool.
+
+    Resolving ``.labels(...)`` takes a lock and a dict lookup on every call;
+    binding the children up front leaves only ``inc``/``observe`` on the
+    per-call path.
+    """
+
+    __slots__ = ("_success_count", "_failure_count", "_duration")
+
+    def __init__(self, tool: str):
+        self._success_count = tool_call_count.labels(tool=tool, status="success")
+        self._failure_count = tool_call_count.labels(tool=tool, status="failure")
+        self._duration = tool_call_duration.labels(tool=tool)
+
+    def record(self, success: bool, duration: float) -> None:
+        """Record a tool call."""
+        (self._success_count if success else self._failure_count).inc()
+        self._duration.observe(duration)
+
+
 def record_tool_error(tool: str, error_type: str) -> None:
     """Record a tool error."""
     tool_error_count.labels(tool=tool, error_type=error_type).inc()
@@ -2,6 +2,7 @@
 OpenTelemetry tracer helpers for agent observability.
 """
 
+import json
 from typing import Any, Optional
 from contextlib import contextmanager
 
@@ -58,13 +59,13 @@ def add_span_attributes(**kwargs: Any) -> None:
     """
     span = trace.get_current_span()
     if span.is_recording():
+        cleaned: dict[str, Any] = {}
         for key, value in kwargs.items():
             # Convert complex types to strings
             if isinstance(value, (dict, list)):
-                import json
-
-                value = json.dumps(value)
-            span.set_attribute(key, value)
+                value = json.dumps(value, separators=(",", ":"))
+            cleaned[key] = value
+        span.set_attributes(cleaned)
 
 
 def add_span_event(name: str, attributes: Optional[dict[str, Any]] = None) -> None:
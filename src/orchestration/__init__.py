@@ -5,12 +5,14 @@ This module provides the state machine orchestration for the multi-agent workflo
 Note: Uses custom implementation instead of LangGraph due to environment constraints.
 """
 
-from src.orchestration.graph import process_ticket, get_workflow
+from src.orchestration.graph import process_ticket, get_workflow, use_workflow, warmup_workflow
 from src.orchestration.state import create_initial_state, AgentState
 
 __all__ = [
     "process_ticket",
     "get_workflow",
+    "use_workflow",
+    "warmup_workflow",
     "create_initial_state",
     "AgentState",
 ]
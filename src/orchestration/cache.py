@@ -0,0 +1,123 @@
+"""
+Execution cache for side-effect-free agent nodes.
+
+Repeat tickets (same customer, subject and body) skip triage's LLM call:
+the routing decision from the first run is returned again on later runs.
+Nodes whose agents call side-effecting tools (refunds, emails) are never
+cached, since a replayed patch would claim actions that never happened.
+"""
+
+import copy
+import hashlib
+from typing import Any, Awaitable, Callable, Dict
+
+from config.settings import settings
+from src.orchestration.patch import run_agent
+from src.observability.logger import get_logger
+from src.utils.cache import TTLCache
+
+logger = get_logger(__name__)
+
+# Nodes whose agents only read (lookups and LLM calls), so they are safe
+# to skip on a repeat ticket
+CACHEABLE_NODES = frozenset({"triage"})
+
+# Patch keys that are cached. Metadata is excluded so cache hits don't
+# report token usage that was never spent, and agent interactions are
+# excluded so hits never replay tool calls.
+CACHED_PATCH_KEYS = ("customer_context", "routing")
+
+
+_node_cache = TTLCache(
+    maxsize=settings.node_cache_max_size,
+    ttl=settings.node_cache_ttl_seconds,
+)
+
+
+def get_node_cache() -> TTLCache:
+    """
+    Get the global node cache.
+
+    Returns:
+        Node cache instance
+    """
+    return _node_cache
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace."""
+    return " ".join(text.lower().split())
+
+
+def make_cache_key(name: str, state: Dict[str, Any]) -> str:
+    """
+    Build a stable cache key for a node and the ticket in the state.
+
+    Args:
+        name: Node name
+        state: Current state
+
+    Returns:
+        Hex digest identifying the node input
+    """
+    customer_context = state.get("customer_context", {})
+    ticket_content = state.get("ticket_content", {})
+
+    fingerprint = "|".join(
+        [
+            name,
+            customer_context.get("customer_id", ""),
+            customer_context.get("tier", "unknown"),
+            ticket_content.get("category_hint") or "",
+            _normalize(ticket_content.get("subject", "")),
+            _normalize(ticket_content.get("body", ""))[:512],
+        ]
+    )
+    return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def cached_node(
+    name: str,
+    state: Dict[str, Any],
+    agent_fn: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Run an agent through the node cache.
+
+    Nodes outside CACHEABLE_NODES always run their agent.
+
+    Args:
+        name: Node name
+        state: Current state (not mutated)
+        agent_fn: Agent execute coroutine function
+
+    Returns:
+        Patch describing the agent's changes (see src.orchestration.patch)
+    """
+    if not settings.node_cache_enabled or name not in CACHEABLE_NODES:
+        return await run_agent(state, agent_fn)
+
+    key = make_cache_key(name, state)
+    cached = _node_cache.get(key)
+
+    if cached is not None:
+        logger.info("node_cache_hit", node=name, ticket_id=state.get("ticket_id"))
+        patch = copy.deepcopy(cached)
+        routing = patch.get("routing", {})
+        patch["agent_interactions"] = [{
+            "agent_name": f"{name}_agent",
+            "timestamp": state.get("timestamp"),
+            "action": "route",
+            "reasoning": routing.get("reasoning"),
+            "tool_calls": [],
+            "result": f"Routed to {routing.get('assigned_agent')} (node cache)",
+        }]
+        return patch
+
+    patch = await run_agent(state, agent_fn)
+
+    _node_cache.set(
+        key,
+        copy.deepcopy({k: v for k, v in patch.items() if k in CACHED_PATCH_KEYS}),
+    )
+    return patch
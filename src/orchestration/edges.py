@@ -2,47 +2,30 @@
 Conditional edge logic for routing between nodes.
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
-from src.observability.logger import get_logger
+# Routing table from triage's assigned_agent to specialist node name.
+# Unknown agents go to escalation.
+AGENT_NODES: Mapping[str, str] = MappingProxyType({
+    "billing_agent": "billing",
+    "technical_agent": "technical",
+    "account_agent": "account",
+    "escalation_agent": "escalation",
+})
 
-logger = get_logger(__name__)
 
-
-def route_after_triage(state: Dict[str, Any]) -> str:
+def node_for_agent(agent_name: str) -> str:
     """
-    Determine which specialist node to route to after triage.
+    Map an agent name from a routing decision to its node name.
 
     Args:
-        state: Current state with routing decision
+        agent_name: Agent name (e.g. "billing_agent")
 
     Returns:
-        Next node name
+        Node name, escalation for unknown agents
     """
-    routing = state.get("routing", {})
-    assigned_agent = routing.get("assigned_agent", "")
-    confidence = routing.get("confidence_score", 0.0)
-
-    logger.info(
-        "routing_decision",
-        assigned_agent=assigned_agent,
-        confidence=confidence,
-        urgency=routing.get("urgency"),
-    )
-
-    # Map agent names to node names
-    agent_to_node = {
-        "billing_agent": "billing",
-        "technical_agent": "technical",
-        "account_agent": "account",
-        "escalation_agent": "escalation",
-    }
-
-    next_node = agent_to_node.get(assigned_agent, "escalation")
-
-    logger.info("routing_to_node", next_node=next_node)
-
-    return next_node
+    return AGENT_NODES.get(agent_name, "escalation")
 
 
 def should_escalate(state: Dict[str, Any]) -> bool:
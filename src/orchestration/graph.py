@@ -5,9 +5,15 @@ This implements a simple state machine without LangGraph dependency,
 providing the same functionality using plain Python.
 """
 
-from typing import Dict, Any, Callable, Awaitable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Awaitable, Iterator, List, Mapping, Optional
+import asyncio
 import time
 
+from config.settings import settings
+
 from src.orchestration.state import create_initial_state
 from src.orchestration.nodes import (
     triage_node,
@@ -15,8 +21,13 @@ from src.orchestration.nodes import (
     technical_node,
     account_node,
     escalation_node,
+    get_agent_pool,
 )
-from src.orchestration.edges import route_after_triage
+from src.orchestration.edges import node_for_agent
+from src.orchestration.patch import apply_patch
+from src.orchestration.semantic_cache import get_semantic_cache
+from src.tools.base import prebuild_input_schemas
+from src.llm.token_counter import estimate_tokens
 from src.observability.logger import get_logger
 from src.observability.tracer import trace_span
 from src.observability.metrics import record_ticket_processed
@@ -24,6 +35,23 @@ from src.observability.metrics import record_ticket_processed
 logger = get_logger(__name__)
 
 
+NodeFn = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# Workflow nodes by name, shared read-only by all workflow instances
+WORKFLOW_NODES: Mapping[str, NodeFn] = MappingProxyType({
+    "triage": triage_node,
+    "billing": billing_node,
+    "technical": technical_node,
+    "account": account_node,
+    "escalation": escalation_node,
+})
+
+# Nodes whose agents only read (lookups and LLM calls). Only these may run
+# speculatively, since a cancelled or discarded run must leave no trace;
+# billing, technical and account send emails or issue refunds.
+SIDE_EFFECT_FREE_NODES = frozenset({"escalation"})
+
+
 class TicketWorkflow:
     """
     Ticket processing workflow orchestrator.
@@ -33,14 +61,16 @@ class TicketWorkflow:
 
     def __init__(self):
         """Initialize workflow."""
-        # Define the node map
-        self.nodes: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
-            "triage": triage_node,
-            "billing": billing_node,
-            "technical": technical_node,
-            "account": account_node,
-            "escalation": escalation_node,
-        }
+        self.nodes = WORKFLOW_NODES
+
+        # Caps bursty LLM spend from speculative dispatch
+        self._speculation_slots = asyncio.Semaphore(settings.speculative_routing_max_concurrency)
+
+        # Load the embedding model up front rather than on the first ticket
+        get_semantic_cache()
+
+        # Build tool input schemas once so the first ticket doesn't pay for it
+        prebuild_input_schemas()
 
         logger.info("workflow_initialized", nodes=list(self.nodes.keys()))
 
@@ -73,7 +103,7 @@ class TicketWorkflow:
             "workflow.execute",
             {"ticket_id": ticket_id, "correlation_id": correlation_id},
         ):
-            start_time = time.time()
+            t0 = time.perf_counter_ns()
 
             logger.info(
                 "workflow_started",
@@ -98,7 +128,7 @@ class TicketWorkflow:
                 state = await self._execute_workflow(state)
 
                 # Record metrics
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - t0) / 1e9
                 routing = state.get("routing", {})
                 record_ticket_processed(
                     category=routing.get("assigned_agent", "unknown"),
@@ -153,20 +183,26 @@ class TicketWorkflow:
         """
         # Step 1: Triage
         logger.info("workflow_step", step="triage", ticket_id=state.get("ticket_id"))
-        state = await triage_node(state)
+        apply_patch(state, await triage_node(state))
 
         # Step 2: Route to appropriate specialist
-        next_node = route_after_triage(state)
+        routing = state.get("routing", {})
+        next_node = node_for_agent(routing.get("assigned_agent"))
         logger.info(
             "workflow_step",
             step=next_node,
             ticket_id=state.get("ticket_id"),
             routed_from="triage",
+            confidence=routing.get("confidence_score"),
+            urgency=routing.get("urgency"),
         )
 
         # Execute specialist node
-        if next_node in self.nodes:
-            state = await self.nodes[next_node](state)
+        speculative_nodes = self._speculative_nodes(state, next_node)
+        if speculative_nodes:
+            await self._execute_speculative(state, speculative_nodes)
+        elif next_node in self.nodes:
+            apply_patch(state, await self.nodes[next_node](state))
         else:
             logger.warning(
                 "workflow_unknown_node",
@@ -174,31 +210,175 @@ class TicketWorkflow:
                 ticket_id=state.get("ticket_id"),
             )
             # Fallback to escalation
-            state = await escalation_node(state)
+            apply_patch(state, await escalation_node(state))
 
         # Check if further escalation is needed
         # (In a more complex workflow, you could add additional routing here)
 
         return state
 
+    def _speculative_nodes(self, state: Dict[str, Any], next_node: str) -> Optional[List[str]]:
+        """
+        Decide whether to run the top-2 specialists speculatively.
+
+        Args:
+            state: State after triage
+            next_node: Node chosen by routing
+
+        Returns:
+            [primary, alternate] node names, or None to run only next_node
+        """
+        if not settings.speculative_routing_enabled:
+            return None
+
+        routing = state.get("routing", {})
+        alternate = routing.get("alternate_agent")
+        if not alternate or routing.get("confidence_score", 1.0) >= settings.speculative_routing_threshold:
+            return None
+
+        alternate_node = node_for_agent(alternate)
+        if alternate_node == next_node or next_node not in self.nodes:
+            return None
+
+        # The alternate's result may be discarded, so it must not act
+        if alternate_node not in SIDE_EFFECT_FREE_NODES:
+            return None
+
+        # At capacity: fall back to the primary route instead of queueing
+        if self._speculation_slots.locked():
+            return None
+
+        return [next_node, alternate_node]
+
+    async def _execute_speculative(self, state: Dict[str, Any], nodes: List[str]) -> Dict[str, Any]:
+        """
+        Run the primary node with the alternate as a hedge.
+
+        Both nodes start at once, but the primary route (triage's preferred,
+        higher-confidence agent) always wins if it succeeds, however long it
+        takes. The alternate's result is only used if the primary fails.
+        Nodes return patches without mutating the state, so they can share it.
+
+        Args:
+            state: State after triage
+            nodes: Node names, primary route first; the alternate must be in
+                SIDE_EFFECT_FREE_NODES
+
+        Returns:
+            State with the selected node's patch applied
+        """
+        logger.info("speculative_dispatch", nodes=nodes, ticket_id=state.get("ticket_id"))
+
+        primary, alternate = nodes
+        async with self._speculation_slots:
+            alternate_task = asyncio.create_task(self.nodes[alternate](state))
+            try:
+                patch = await self.nodes[primary](state)
+            except Exception as primary_error:
+                try:
+                    patch = await alternate_task
+                except Exception:
+                    raise primary_error
+                apply_patch(state, patch)
+                return self._select_speculative(state, alternate, primary)
+            finally:
+                alternate_task.cancel()
+
+        apply_patch(state, patch)
+        return self._select_speculative(state, primary, primary)
+
+    def _select_speculative(self, state: Dict[str, Any], winner: str, primary: str) -> Dict[str, Any]:
+        """Record which speculative node was used, swapping routing if it was the alternate."""
+        logger.info(
+            "speculative_winner",
+            node=winner,
+            primary=primary,
+            ticket_id=state.get("ticket_id"),
+        )
+        if winner != primary:
+            routing = state["routing"]
+            routing["assigned_agent"], routing["alternate_agent"] = (
+                routing["alternate_agent"],
+                routing["assigned_agent"],
+            )
+        return state
+
 
 # Global workflow instance
-_workflow: TicketWorkflow = None
+_workflow: Optional[TicketWorkflow] = None
+
+# Per-context override (e.g. per tenant or per test); tasks inherit it
+_workflow_override: ContextVar[Optional[TicketWorkflow]] = ContextVar(
+    "workflow_override", default=None
+)
 
 
 def get_workflow() -> TicketWorkflow:
     """
-    Get the global workflow instance.
+    Get the workflow for the current context.
+
+    Returns the override installed by use_workflow() if any, otherwise the
+    process-wide instance.
 
     Returns:
         TicketWorkflow instance
     """
+    override = _workflow_override.get()
+    if override is not None:
+        return override
+
     global _workflow
     if _workflow is None:
         _workflow = TicketWorkflow()
     return _workflow
 
 
+@contextmanager
+def use_workflow(workflow: TicketWorkflow) -> Iterator[TicketWorkflow]:
+    """
+    Use a different workflow for the current context.
+
+    Tickets processed inside the block (including tasks started from it)
+    go through ``workflow``; other contexts keep the global instance.
+
+    Args:
+        workflow: Workflow to use
+
+    Yields:
+        The workflow
+    """
+    token = _workflow_override.set(workflow)
+    try:
+        yield workflow
+    finally:
+        _workflow_override.reset(token)
+
+
+async def warmup_workflow() -> None:
+    """
+    Create the workflow and one instance of every agent.
+
+    Moves first-call costs (agent and tool construction, tokenizer and
+    schema initialization) out of the first real ticket's latency. No
+    agent is run: specialists send emails and issue refunds, and every
+    agent would spend LLM calls on a ticket that doesn't exist.
+    """
+    with trace_span("workflow.warmup"):
+        # Builds tool input schemas and loads the semantic cache model
+        get_workflow()
+
+        agents = ["triage", "billing", "technical", "account", "escalation"]
+        for name in agents:
+            # Checking an agent out constructs it (and its tools) in the pool
+            async with get_agent_pool(name).use():
+                pass
+
+        # Load the tokenizer's encoding tables
+        estimate_tokens("warmup")
+
+        logger.info("workflow_warmed_up", agents=agents)
+
+
 async def process_ticket(
     ticket_id: str,
     correlation_id: str,
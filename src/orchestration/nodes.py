@@ -1,7 +1,8 @@
 """
 Node functions for the agent workflow.
 
-Each node wraps an agent and updates the state.
+Each node wraps an agent and returns a patch of the state changes it made;
+the orchestrator applies it (see src.orchestration.patch).
 """
 
 from typing import Dict, Any
@@ -12,57 +13,37 @@ from src.agents.billing_agent import BillingAgent
 from src.agents.technical_agent import TechnicalAgent
 from src.agents.account_agent import AccountAgent
 from src.agents.escalation_agent import EscalationAgent
+from config.settings import settings
+from src.orchestration.cache import cached_node
+from src.orchestration.patch import run_agent
+from src.orchestration.pool import AgentPool
+from src.orchestration.semantic_cache import get_semantic_cache
 from src.observability.logger import get_logger
 from src.observability.tracer import trace_span
 
 logger = get_logger(__name__)
 
-# Global agent instances (initialized once)
-_triage_agent = None
-_billing_agent = None
-_technical_agent = None
-_account_agent = None
-_escalation_agent = None
+# Agent pools, one per agent type (agents are created on first checkout)
+_agent_pools: Dict[str, AgentPool] = {
+    "triage": AgentPool(TriageAgent, size=settings.agent_pool_size),
+    "billing": AgentPool(BillingAgent, size=settings.agent_pool_size),
+    "technical": AgentPool(TechnicalAgent, size=settings.agent_pool_size),
+    "account": AgentPool(AccountAgent, size=settings.agent_pool_size),
+    "escalation": AgentPool(EscalationAgent, size=settings.agent_pool_size),
+}
 
 
-def get_triage_agent() -> TriageAgent:
-    """Get or create triage agent instance."""
-    global _triage_agent
-    if _triage_agent is None:
-        _triage_agent = TriageAgent()
-    return _triage_agent
-
-
-def get_billing_agent() -> BillingAgent:
-    """Get or create billing agent instance."""
-    global _billing_agent
-    if _billing_agent is None:
-        _billing_agent = BillingAgent()
-    return _billing_agent
-
-
-def get_technical_agent() -> TechnicalAgent:
-    """Get or create technical agent instance."""
-    global _technical_agent
-    if _technical_agent is None:
-        _technical_agent = TechnicalAgent()
-    return _technical_agent
-
-
-def get_account_agent() -> AccountAgent:
-    """Get or create account agent instance."""
-    global _account_agent
-    if _account_agent is None:
-        _account_agent = AccountAgent()
-    return _account_agent
+def get_agent_pool(name: str) -> AgentPool:
+    """
+    Get the agent pool for a node.
 
+    Args:
+        name: Node name (triage, billing, technical, account, escalation)
 
-def get_escalation_agent() -> EscalationAgent:
-    """Get or create escalation agent instance."""
-    global _escalation_agent
-    if _escalation_agent is None:
-        _escalation_agent = EscalationAgent()
-    return _escalation_agent
+    Returns:
+        AgentPool instance
+    """
+    return _agent_pools[name]
 
 
 async def triage_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -73,29 +54,49 @@ async def triage_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: Current state
 
     Returns:
-        Updated state with routing decision
+        Patch with routing decision
     """
     with trace_span("node.triage"):
-        start_time = time.time()
-
-        logger.info("node_started", node="triage", ticket_id=state.get("ticket_id"))
-
-        agent = get_triage_agent()
-        state = await agent.execute(state)
-
-        duration_ms = int((time.time() - start_time) * 1000)
-        if "metadata" in state and "latency_ms" in state["metadata"]:
-            state["metadata"]["latency_ms"]["triage"] = duration_ms
+        t0 = time.perf_counter_ns()
+
+        ticket_id = state.get("ticket_id")
+        logger.info("node_started", node="triage", ticket_id=ticket_id)
+
+        semantic_cache = get_semantic_cache()
+        routing = None
+        if semantic_cache is not None:
+            routing, embedding = await semantic_cache.lookup(state)
+
+        if routing is not None:
+            logger.info("semantic_cache_hit", node="triage", ticket_id=ticket_id)
+            patch = {
+                "routing": routing,
+                "agent_interactions": [{
+                    "agent_name": "triage_agent",
+                    "timestamp": state.get("timestamp"),
+                    "action": "route",
+                    "reasoning": routing.get("reasoning"),
+                    "tool_calls": [],
+                    "result": f"Routed to {routing.get('assigned_agent')} (semantic cache)",
+                }],
+            }
+        else:
+            patch = await cached_node("triage", state, get_agent_pool("triage").execute)
+            if semantic_cache is not None:
+                semantic_cache.add(embedding, {**state.get("routing", {}), **patch.get("routing", {})})
+
+        duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        patch.setdefault("metadata", {}).setdefault("latency_ms", {})["triage"] = duration_ms
 
         logger.info(
             "node_completed",
             node="triage",
-            ticket_id=state.get("ticket_id"),
-            assigned_agent=state.get("routing", {}).get("assigned_agent"),
+            ticket_id=ticket_id,
+            assigned_agent=patch.get("routing", {}).get("assigned_agent"),
             duration_ms=duration_ms,
         )
 
-        return state
+        return patch
 
 
 async def billing_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -106,28 +107,27 @@ async def billing_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: Current state
 
     Returns:
-        Updated state with resolution
+        Patch with resolution
     """
     with trace_span("node.billing"):
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
 
-        logger.info("node_started", node="billing", ticket_id=state.get("ticket_id"))
+        ticket_id = state.get("ticket_id")
+        logger.info("node_started", node="billing", ticket_id=ticket_id)
 
-        agent = get_billing_agent()
-        state = await agent.execute(state)
+        patch = await run_agent(state, get_agent_pool("billing").execute)
 
-        duration_ms = int((time.time() - start_time) * 1000)
-        if "metadata" in state and "latency_ms" in state["metadata"]:
-            state["metadata"]["latency_ms"]["billing"] = duration_ms
+        duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        patch.setdefault("metadata", {}).setdefault("latency_ms", {})["billing"] = duration_ms
 
         logger.info(
             "node_completed",
             node="billing",
-            ticket_id=state.get("ticket_id"),
+            ticket_id=ticket_id,
             duration_ms=duration_ms,
         )
 
-        return state
+        return patch
 
 
 async def technical_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -138,28 +138,27 @@ async def technical_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: Current state
 
     Returns:
-        Updated state with resolution
+        Patch with resolution
     """
     with trace_span("node.technical"):
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
 
-        logger.info("node_started", node="technical", ticket_id=state.get("ticket_id"))
+        ticket_id = state.get("ticket_id")
+        logger.info("node_started", node="technical", ticket_id=ticket_id)
 
-        agent = get_technical_agent()
-        state = await agent.execute(state)
+        patch = await run_agent(state, get_agent_pool("technical").execute)
 
-        duration_ms = int((time.time() - start_time) * 1000)
-        if "metadata" in state and "latency_ms" in state["metadata"]:
-            state["metadata"]["latency_ms"]["technical"] = duration_ms
+        duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        patch.setdefault("metadata", {}).setdefault("latency_ms", {})["technical"] = duration_ms
 
         logger.info(
             "node_completed",
             node="technical",
-            ticket_id=state.get("ticket_id"),
+            ticket_id=ticket_id,
             duration_ms=duration_ms,
         )
 
-        return state
+        return patch
 
 
 async def account_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -170,28 +169,27 @@ async def account_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: Current state
 
     Returns:
-        Updated state with resolution
+        Patch with resolution
     """
     with trace_span("node.account"):
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
 
-        logger.info("node_started", node="account", ticket_id=state.get("ticket_id"))
+        ticket_id = state.get("ticket_id")
+        logger.info("node_started", node="account", ticket_id=ticket_id)
 
-        agent = get_account_agent()
-        state = await agent.execute(state)
+        patch = await run_agent(state, get_agent_pool("account").execute)
 
-        duration_ms = int((time.time() - start_time) * 1000)
-        if "metadata" in state and "latency_ms" in state["metadata"]:
-            state["metadata"]["latency_ms"]["account"] = duration_ms
+        duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        patch.setdefault("metadata", {}).setdefault("latency_ms", {})["account"] = duration_ms
 
         logger.info(
             "node_completed",
             node="account",
-            ticket_id=state.get("ticket_id"),
+            ticket_id=ticket_id,
             duration_ms=duration_ms,
         )
 
-        return state
+        return patch
 
 
 async def escalation_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -202,26 +200,25 @@ async def escalation_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: Current state
 
     Returns:
-        Updated state with resolution or human escalation
+        Patch with resolution or human escalation
     """
     with trace_span("node.escalation"):
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
 
-        logger.info("node_started", node="escalation", ticket_id=state.get("ticket_id"))
+        ticket_id = state.get("ticket_id")
+        logger.info("node_started", node="escalation", ticket_id=ticket_id)
 
-        agent = get_escalation_agent()
-        state = await agent.execute(state)
+        patch = await run_agent(state, get_agent_pool("escalation").execute)
 
-        duration_ms = int((time.time() - start_time) * 1000)
-        if "metadata" in state and "latency_ms" in state["metadata"]:
-            state["metadata"]["latency_ms"]["escalation"] = duration_ms
+        duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        patch.setdefault("metadata", {}).setdefault("latency_ms", {})["escalation"] = duration_ms
 
         logger.info(
             "node_completed",
             node="escalation",
-            ticket_id=state.get("ticket_id"),
-            requires_human=state.get("resolution", {}).get("requires_human"),
+            ticket_id=ticket_id,
+            requires_human=patch.get("resolution", {}).get("requires_human"),
             duration_ms=duration_ms,
         )
 
-        return state
+        return patch
@@ -0,0 +1,111 @@
+"""
+State patches produced by workflow nodes.
+
+Nodes don't mutate the workflow state. Each runs its agent on a cheap
+overlay of the state and returns only what changed, for example
+``{"routing": {...}, "metadata": {"latency_ms": {"triage": 812}}}``.
+The orchestrator applies patches with ``apply_patch``.
+
+New agent interactions are carried under ``agent_interactions`` and are
+appended to the state's list rather than replacing it.
+"""
+
+from typing import Any, Awaitable, Callable, Dict
+
+_MISSING = object()
+
+
+def overlay(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy the state deeply enough for an agent to mutate it in place.
+
+    Dicts are copied two levels down (agents write e.g.
+    ``metadata["token_usage"]["triage"]``) and lists are copied shallowly;
+    leaf values are shared with the original state.
+
+    Args:
+        state: Workflow state
+
+    Returns:
+        Working copy of the state
+    """
+    working = {}
+    for key, value in state.items():
+        if isinstance(value, dict):
+            working[key] = {
+                k: v.copy() if isinstance(v, (dict, list)) else v
+                for k, v in value.items()
+            }
+        elif isinstance(value, list):
+            working[key] = list(value)
+        else:
+            working[key] = value
+    return working
+
+
+def diff(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the nested keys in ``after`` that differ from ``before``."""
+    delta = {}
+    for key, value in after.items():
+        old = before.get(key, _MISSING)
+        if value is old:
+            continue
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = diff(old, value)
+            if nested:
+                delta[key] = nested
+        elif value != old:
+            delta[key] = value
+    return delta
+
+
+def merge(target: Dict[str, Any], patch: Dict[str, Any]) -> None:
+    """Recursively apply a diff produced by ``diff`` to ``target``."""
+    for key, value in patch.items():
+        existing = target.get(key)
+        if isinstance(value, dict) and isinstance(existing, dict):
+            merge(existing, value)
+        else:
+            target[key] = value
+
+
+def apply_patch(state: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply a node patch to the workflow state.
+
+    Args:
+        state: Workflow state (mutated)
+        patch: Patch returned by a node
+
+    Returns:
+        The updated state
+    """
+    interactions = patch.get("agent_interactions")
+    if interactions:
+        state.setdefault("agent_interactions", []).extend(interactions)
+    merge(state, {k: v for k, v in patch.items() if k != "agent_interactions"})
+    return state
+
+
+async def run_agent(
+    state: Dict[str, Any],
+    agent_fn: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Run an agent on an overlay of the state and return its changes.
+
+    Args:
+        state: Workflow state (not mutated)
+        agent_fn: Agent execute coroutine function
+
+    Returns:
+        Patch describing the agent's changes
+    """
+    interaction_count = len(state.get("agent_interactions", []))
+    working = await agent_fn(overlay(state))
+
+    interactions = working.pop("agent_interactions", [])[interaction_count:]
+    patch = diff({k: v for k, v in state.items() if k != "agent_interactions"}, working)
+    if interactions:
+        patch["agent_interactions"] = interactions
+    return patch
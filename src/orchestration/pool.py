@@ -0,0 +1,77 @@
+"""
+Bounded pools of agent instances.
+
+Each node checks an agent out of its pool for the duration of one
+execution, capping how many tickets a given agent works on at once and
+smoothing bursts before they reach the LLM provider.
+"""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Generic, TypeVar
+
+A = TypeVar("A")
+
+
+class AgentPool(Generic[A]):
+    """
+    Fixed-size pool of agent instances with exclusive checkout.
+
+    Agents are created lazily, up to ``size``; callers beyond that wait
+    until an agent is returned.
+    """
+
+    def __init__(self, factory: Callable[[], A], size: int = 4):
+        """
+        Initialize pool.
+
+        Args:
+            factory: Creates a new agent instance
+            size: Maximum concurrent checkouts (and instances)
+        """
+        self._factory = factory
+        self.size = size
+        self._idle: Deque[A] = deque()
+        self._created = 0
+        self._semaphore = asyncio.Semaphore(size)
+
+    def _checkout(self) -> A:
+        """Take an idle agent, creating one if none is idle."""
+        if self._idle:
+            return self._idle.pop()
+        self._created += 1
+        return self._factory()
+
+    @asynccontextmanager
+    async def use(self) -> AsyncIterator[A]:
+        """
+        Check out an agent for the duration of the block.
+
+        Yields:
+            Agent instance, exclusive to the caller until the block exits
+        """
+        async with self._semaphore:
+            agent = self._checkout()
+            try:
+                yield agent
+            finally:
+                self._idle.append(agent)
+
+    async def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a pooled agent's execute() on the state.
+
+        Args:
+            state: Current state
+
+        Returns:
+            Updated state
+        """
+        async with self.use() as agent:
+            return await agent.execute(state)
+
+    @property
+    def in_use(self) -> int:
+        """Number of agents currently checked out."""
+        return self._created - len(self._idle)
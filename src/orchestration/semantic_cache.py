@@ -0,0 +1,180 @@
+"""
+Embedding-based routing cache for the triage node.
+
+Paraphrased tickets ("my card was declined" / "payment card rejected")
+should route identically, so triage decisions are cached by sentence
+embedding and reused when a new ticket is similar enough.
+
+Requires the optional ``semantic`` extra (sentence-transformers, numpy)
+and is disabled unless ``semantic_cache_enabled`` is set.
+"""
+
+import asyncio
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from config.settings import settings
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SemanticRoutingCache:
+    """
+    In-process nearest-neighbour cache of routing decisions.
+
+    Embeddings are normalized, so a matrix-vector product over the stored
+    embeddings gives cosine similarity to every cached ticket.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        threshold: float = 0.92,
+        max_entries: int = 10000,
+        path: Optional[str] = None,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            model_name: sentence-transformers model to embed tickets with
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum cached decisions (oldest overwritten first)
+            path: Optional file to load from and save to
+
+        Raises:
+            ImportError: If sentence-transformers or numpy is not installed
+        """
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+
+        self._np = np
+        self._encoder = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+
+        dimension = self._encoder.get_sentence_embedding_dimension()
+        self._embeddings = np.zeros((max_entries, dimension), dtype=np.float32)
+        self._routings: list[Dict[str, Any]] = []
+        self._next = 0
+
+        if self.path and self.path.exists():
+            self.load()
+
+    def _ticket_text(self, state: Dict[str, Any]) -> str:
+        ticket_content = state.get("ticket_content", {})
+        return f"{ticket_content.get('subject', '')} {ticket_content.get('body', '')[:512]}"
+
+    async def lookup(self, state: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """
+        Find a cached routing decision for a similar ticket.
+
+        The ticket is embedded in a worker thread so encoding doesn't block
+        the event loop.
+
+        Args:
+            state: Current state with ticket content
+
+        Returns:
+            Tuple of (routing dict or None on miss, ticket embedding)
+        """
+        embedding = await asyncio.to_thread(
+            self._encoder.encode,
+            self._ticket_text(state),
+            normalize_embeddings=True,
+        )
+        embedding = embedding.astype(self._np.float32)
+
+        size = len(self._routings)
+        if size == 0:
+            return None, embedding
+
+        scores = self._embeddings[:size] @ embedding
+        best = int(scores.argmax())
+        if scores[best] < self.threshold:
+            return None, embedding
+
+        return copy.deepcopy(self._routings[best]), embedding
+
+    def add(self, embedding: Any, routing: Dict[str, Any]) -> None:
+        """
+        Cache a routing decision.
+
+        Args:
+            embedding: Ticket embedding returned by lookup()
+            routing: Routing decision made by the triage agent
+        """
+        index = self._next % self.max_entries
+        self._embeddings[index] = embedding
+        if index < len(self._routings):
+            self._routings[index] = copy.deepcopy(routing)
+        else:
+            self._routings.append(copy.deepcopy(routing))
+        self._next += 1
+
+    def save(self) -> None:
+        """Persist cached decisions to ``path``."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as f:
+            self._np.savez(
+                f,
+                embeddings=self._embeddings[: len(self._routings)],
+                routings=json.dumps(self._routings),
+                next=self._next,
+            )
+        logger.info("semantic_cache_saved", path=str(self.path), entries=len(self._routings))
+
+    def load(self) -> None:
+        """Load cached decisions from ``path``."""
+        data = self._np.load(self.path)
+        embeddings = data["embeddings"][: self.max_entries]
+        self._embeddings[: len(embeddings)] = embeddings
+        self._routings = json.loads(str(data["routings"]))[: self.max_entries]
+        self._next = int(data["next"])
+        logger.info("semantic_cache_loaded", path=str(self.path), entries=len(self._routings))
+
+    def __len__(self) -> int:
+        return len(self._routings)
+
+
+# Global cache instance
+_semantic_cache: Optional[SemanticRoutingCache] = None
+_semantic_cache_unavailable = False
+
+
+def get_semantic_cache() -> Optional[SemanticRoutingCache]:
+    """
+    Get the global semantic routing cache.
+
+    Returns:
+        Cache instance, or None if disabled or dependencies are missing
+    """
+    global _semantic_cache, _semantic_cache_unavailable
+    if not settings.semantic_cache_enabled or _semantic_cache_unavailable:
+        return None
+
+    if _semantic_cache is None:
+        try:
+            _semantic_cache = SemanticRoutingCache(
+                model_name=settings.semantic_cache_model,
+                threshold=settings.semantic_cache_threshold,
+                path=settings.semantic_cache_path or None,
+            )
+        except ImportError as e:
+            logger.warning("semantic_cache_unavailable", reason=str(e))
+            _semantic_cache_unavailable = True
+            return None
+
+    return _semantic_cache
+
+
+def save_semantic_cache() -> None:
+    """Persist the semantic cache if it has been created."""
+    if _semantic_cache is not None:
+        _semantic_cache.save()
@@ -6,11 +6,11 @@ This provides the same state management functionality.
 """
 
 from typing import Dict, Any, List, Optional
-from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerContext:
     """Customer context information."""
     customer_id: str
@@ -20,7 +20,7 @@ class CustomerContext:
     history: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketContent:
     """Ticket content."""
     subject: str
@@ -28,16 +28,17 @@ class TicketContent:
     category_hint: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Routing:
     """Routing decision."""
     urgency: str = "medium"
     assigned_agent: str = ""
     confidence_score: float = 0.0
     reasoning: str = ""
+    alternate_agent: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentInteraction:
     """Record of an agent interaction."""
     agent_name: str
@@ -48,7 +49,7 @@ class AgentInteraction:
     result: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Resolution:
     """Ticket resolution."""
     status: str = "pending"
@@ -57,7 +58,7 @@ class Resolution:
     satisfaction_predicted: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     """Processing metadata."""
     token_usage: Dict[str, Any] = field(default_factory=dict)
@@ -66,7 +67,7 @@ class Metadata:
     retry_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """
     Complete agent state for the support ticket workflow.
@@ -84,17 +85,64 @@ class AgentState:
     metadata: Metadata = field(default_factory=Metadata)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert state to dictionary."""
+        """
+        Convert state to dictionary.
+
+        Built field by field rather than with ``dataclasses.asdict``, which
+        deep-copies every value. Nested lists and dicts are shallow-copied.
+        """
+        customer_context = self.customer_context
+        ticket_content = self.ticket_content
+        routing = self.routing
+        resolution = self.resolution
+        metadata = self.metadata
+
         return {
             "ticket_id": self.ticket_id,
             "correlation_id": self.correlation_id,
             "timestamp": self.timestamp,
-            "customer_context": asdict(self.customer_context),
-            "ticket_content": asdict(self.ticket_content),
-            "routing": asdict(self.routing),
-            "agent_interactions": [asdict(i) for i in self.agent_interactions],
-            "resolution": asdict(self.resolution),
-            "metadata": asdict(self.metadata),
+            "customer_context": {
+                "customer_id": customer_context.customer_id,
+                "tier": customer_context.tier,
+                "email": customer_context.email,
+                "account_status": customer_context.account_status,
+                "history": list(customer_context.history),
+            },
+            "ticket_content": {
+                "subject": ticket_content.subject,
+                "body": ticket_content.body,
+                "category_hint": ticket_content.category_hint,
+            },
+            "routing": {
+                "urgency": routing.urgency,
+                "assigned_agent": routing.assigned_agent,
+                "confidence_score": routing.confidence_score,
+                "reasoning": routing.reasoning,
+                "alternate_agent": routing.alternate_agent,
+            },
+            "agent_interactions": [
+                {
+                    "agent_name": i.agent_name,
+                    "timestamp": i.timestamp,
+                    "action": i.action,
+                    "reasoning": i.reasoning,
+                    "tool_calls": list(i.tool_calls),
+                    "result": i.result,
+                }
+                for i in self.agent_interactions
+            ],
+            "resolution": {
+                "status": resolution.status,
+                "response": resolution.response,
+                "requires_human": resolution.requires_human,
+                "satisfaction_predicted": resolution.satisfaction_predicted,
+            },
+            "metadata": {
+                "token_usage": dict(metadata.token_usage),
+                "latency_ms": dict(metadata.latency_ms),
+                "error_count": metadata.error_count,
+                "retry_count": metadata.retry_count,
+            },
         }
 
     @classmethod
@@ -115,6 +163,24 @@ class AgentState:
         )
 
 
+# Flat defaults shared by every new ticket; cloned with dict.copy() since
+# all values are immutable scalars.
+_ROUTING_TEMPLATE: Dict[str, Any] = {
+    "urgency": "medium",
+    "assigned_agent": "",
+    "confidence_score": 0.0,
+    "reasoning": "",
+    "alternate_agent": "",
+}
+
+_RESOLUTION_TEMPLATE: Dict[str, Any] = {
+    "status": "pending",
+    "response": "",
+    "requires_human": False,
+    "satisfaction_predicted": None,
+}
+
+
 def create_initial_state(
     ticket_id: str,
     correlation_id: str,
@@ -142,7 +208,7 @@ def create_initial_state(
     return {
         "ticket_id": ticket_id,
         "correlation_id": correlation_id,
-        "timestamp": datetime.utcnow(),
+        "timestamp": datetime.now(timezone.utc),
         "customer_context": {
             "customer_id": customer_id,
             "tier": "unknown",
@@ -155,19 +221,10 @@ def create_initial_state(
             "body": body,
             "category_hint": category_hint,
         },
-        "routing": {
-            "urgency": "medium",
-            "assigned_agent": "",
-            "confidence_score": 0.0,
-            "reasoning": "",
-        },
+        "routing": _ROUTING_TEMPLATE.copy(),
         "agent_interactions": [],
-        "resolution": {
-            "status": "pending",
-            "response": "",
-            "requires_human": False,
-            "satisfaction_predicted": None,
-        },
+        "resolution": _RESOLUTION_TEMPLATE.copy(),
+        # Built fresh: the nested dicts must not be shared between tickets
         "metadata": {
             "token_usage": {},
             "latency_ms": {},
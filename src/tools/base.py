@@ -2,26 +2,99 @@
 Base tool class with observability and tracing.
 """
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Type
+from pydantic import BaseModel, ConfigDict
 
 from src.observability.logger import get_logger
 from src.observability.decorators import trace_tool
 
 
 class ToolInput(BaseModel):
-    """Base model for tool inputs."""
+    """
+    Base model for tool inputs.
+
+    Inputs are immutable once validated, which also makes them hashable,
+    and reject unknown fields so typos in agent code fail loudly.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    def preview(self, limit: int = 200, field_limit: int = 50) -> str:
+        """
+        Build a bounded, log-friendly summary of the input.
+
+        Long string fields (e.g. email bodies) are truncated before being
+        formatted, so the cost doesn't grow with the input size.
+
+        Args:
+            limit: Maximum preview length
+            field_limit: Maximum characters kept per string field
+
+        Returns:
+            Preview such as "to='a@b.com', body='Hello...'(len=5120)"
+        """
+        parts = []
+        length = 0
+        for name, value in self:
+            if isinstance(value, str) and len(value) > field_limit:
+                part = f"{name}={value[:field_limit]!r}...(len={len(value)})"
+            else:
+                part = f"{name}={value!r}"
+            parts.append(part)
+            length += len(part) + 2
+            if length >= limit:
+                break
+        return ", ".join(parts)[:limit]
+
+
+@functools.cache
+def get_input_schema(model: Type[ToolInput]) -> Dict[str, Any]:
+    """
+    Get the JSON schema for a tool input model, built once per class.
 
-    pass
+    Args:
+        model: ToolInput subclass
+
+    Returns:
+        JSON schema (shared; do not mutate)
+    """
+    return model.model_json_schema()
 
 
-class ToolOutput(BaseModel):
-    """Base model for tool outputs."""
+def prebuild_input_schemas() -> None:
+    """Build and cache JSON schemas for every ToolInput subclass defined so far."""
+    pending = list(ToolInput.__subclasses__())
+    while pending:
+        model = pending.pop()
+        get_input_schema(model)
+        pending.extend(model.__subclasses__())
 
-    success: bool = Field(..., description="Whether the tool execution succeeded")
-    result: Any = Field(..., description="Tool execution result")
-    error: Optional[str] = Field(None, description="Error message if failed")
+
+@dataclass(slots=True)
+class ToolOutput:
+    """
+    Tool output.
+
+    A plain dataclass rather than a Pydantic model: outputs are built by
+    BaseTool on every call from already-typed values, so validation would
+    be pure overhead.
+
+    Attributes:
+        success: Whether the tool execution succeeded
+        result: Tool execution result
+        error: Error message if failed
+    """
+
+    success: bool
+    result: Any
+    error: Optional[str] = None
+
+    def dict(self) -> Dict[str, Any]:
+        """Return the output as a dictionary (Pydantic-compatible)."""
+        return asdict(self)
 
 
 class BaseTool(ABC):
@@ -59,6 +132,14 @@ class BaseTool(ABC):
         """
         pass
 
+    async def warmup(self) -> None:
+        """
+        Prepare the tool before it serves requests.
+
+        Override in tools with expensive setup (connections, indexes).
+        Called once at startup by ToolRegistry.ensure_initialized().
+        """
+
     @trace_tool("base_tool")
     async def execute(self, input_data: ToolInput) -> ToolOutput:
         """
@@ -76,7 +157,7 @@ class BaseTool(ABC):
             self.logger.info(
                 "tool_executing",
                 tool=self.name,
-                input=str(input_data.dict())[:200],  # Truncate for logging
+                input=input_data.preview(),
             )
 
             result = await self._execute(input_data)
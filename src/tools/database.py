@@ -2,9 +2,13 @@
 Mock database tool for customer and ticket queries.
 """
 
+import asyncio
+import functools
 from typing import Any, Dict, List, Optional
 from pydantic import Field
 
+from config.settings import settings
+from src.observability.decorators import trace_tool
 from src.tools.base import BaseTool, ToolInput, ToolOutput
 
 
@@ -93,9 +97,72 @@ MOCK_PAYMENTS = {
 }
 
 
+# Precomputed and memoized responses are shared between callers: treat every
+# DatabaseTool result as immutable.
+_CUSTOMER_RESPONSES = {
+    customer_id: {"found": True, "customer": customer}
+    for customer_id, customer in MOCK_CUSTOMERS.items()
+}
+
+SUPPORTED_QUERY_TYPES = ("customer_info", "ticket_history", "payment_history")
+
+
+@functools.lru_cache(maxsize=1024)
+def _customer_not_found(customer_id: str) -> Dict[str, Any]:
+    """Negative lookup result (memoized, bounded since IDs are open-ended)."""
+    return {
+        "found": False,
+        "message": f"Customer {customer_id} not found",
+    }
+
+
+def _customer_info(customer_id: str) -> Dict[str, Any]:
+    """Look up customer information."""
+    response = _CUSTOMER_RESPONSES.get(customer_id)
+    if response is None:
+        return _customer_not_found(customer_id)
+    return response
+
+
+@functools.lru_cache(maxsize=4096)
+def _ticket_history(customer_id: str, limit: int) -> Dict[str, Any]:
+    """Look up a customer's most recent tickets (memoized)."""
+    tickets = MOCK_TICKETS.get(customer_id, [])
+    return {
+        "found": len(tickets) > 0,
+        "tickets": tickets[:limit],
+        "total_count": len(tickets),
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _payment_history(customer_id: str, limit: int) -> Dict[str, Any]:
+    """Look up a customer's most recent payments (memoized)."""
+    payments = MOCK_PAYMENTS.get(customer_id, [])
+    return {
+        "found": len(payments) > 0,
+        "payments": payments[:limit],
+        "total_count": len(payments),
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _unknown_query(query_type: str) -> Dict[str, Any]:
+    """Error result for an unsupported query type (memoized)."""
+    return {
+        "error": f"Unknown query type: {query_type}",
+        "supported_types": list(SUPPORTED_QUERY_TYPES),
+    }
+
+
 class DatabaseTool(BaseTool):
     """Mock database query tool."""
 
+    # Called on nearly every ticket, so only a sample of calls get a span
+    execute = trace_tool("database_query", sample=settings.tool_trace_sample_rate)(
+        BaseTool.execute.__wrapped__
+    )
+
     def __init__(self):
         super().__init__(
             name="database_query",
@@ -110,42 +177,34 @@ class DatabaseTool(BaseTool):
             input_data: Query parameters
 
         Returns:
-            Query results
+            Query results (shared between calls; do not mutate)
         """
         customer_id = input_data.customer_id
         query_type = input_data.query_type
-        limit = input_data.limit
 
         if query_type == "customer_info":
-            # Return customer information
-            customer = MOCK_CUSTOMERS.get(customer_id)
-            if not customer:
-                return {
-                    "found": False,
-                    "message": f"Customer {customer_id} not found",
-                }
-            return {"found": True, "customer": customer}
+            return _customer_info(customer_id)
 
         elif query_type == "ticket_history":
-            # Return ticket history
-            tickets = MOCK_TICKETS.get(customer_id, [])
-            return {
-                "found": len(tickets) > 0,
-                "tickets": tickets[:limit],
-                "total_count": len(tickets),
-            }
+            return _ticket_history(customer_id, input_data.limit)
 
         elif query_type == "payment_history":
-            # Return payment history
-            payments = MOCK_PAYMENTS.get(customer_id, [])
-            return {
-                "found": len(payments) > 0,
-                "payments": payments[:limit],
-                "total_count": len(payments),
-            }
+            return _payment_history(customer_id, input_data.limit)
 
         else:
-            return {
-                "error": f"Unknown query type: {query_type}",
-                "supported_types": ["customer_info", "ticket_history", "payment_history"],
-            }
+            return _unknown_query(query_type)
+
+    async def multi_query(self, requests: List[DatabaseQueryInput]) -> List[ToolOutput]:
+        """
+        Execute several queries at once.
+
+        This is the batching point for a real database backend (one round
+        trip for all queries); the mock runs them concurrently.
+
+        Args:
+            requests: Queries to execute
+
+        Returns:
+            Tool outputs, in request order
+        """
+        return list(await asyncio.gather(*(self.execute(r) for r in requests)))
@@ -2,9 +2,10 @@
 Mock email sending tool.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional
+import httpx
 from pydantic import Field
-import random
+import itertools
 
 from src.tools.base import BaseTool, ToolInput
 
@@ -18,14 +19,36 @@ class EmailInput(ToolInput):
     template: str = Field(default="default", description="Email template name")
 
 
+# Send counter driving the deterministic failure pattern and message IDs.
+# Starts at 1 so the first send of a process succeeds.
+_email_counter = itertools.count(1)
+
+# Every 32nd send fails (~3%), standing in for a flaky email service
+_FAILURE_MASK = 0x1F
+
+
 class EmailTool(BaseTool):
     """Mock email sending tool."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        send_counter: Optional[Iterator[int]] = None,
+    ):
+        """
+        Initialize tool.
+
+        Args:
+            http_client: Shared HTTP client for calls to the real service
+            send_counter: Send number sequence deciding which sends fail
+                (default: the process-wide counter)
+        """
         super().__init__(
             name="email_sender",
             description="Send emails to customers for confirmations, notifications, and updates",
         )
+        self.http_client = http_client
+        self._send_counter = send_counter if send_counter is not None else _email_counter
 
     async def _execute(self, input_data: EmailInput) -> Dict[str, Any]:
         """
@@ -37,11 +60,12 @@ class EmailTool(BaseTool):
         Returns:
             Send result
         """
-        # Simulate success most of the time
-        success = random.random() > 0.05  # 95% success rate
+        # Simulate success most of the time, deterministically
+        n = next(self._send_counter)
+        success = n & _FAILURE_MASK
 
         if success:
-            message_id = f"MSG-{random.randint(100000, 999999)}"
+            message_id = f"MSG-{100000 + n % 900000}"
 
             # Log email content (in real implementation, this would send)
             self.logger.info(
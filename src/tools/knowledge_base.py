@@ -2,9 +2,17 @@
 Mock knowledge base search tool.
 """
 
-from typing import Any, Dict, List
+import heapq
+import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
 from pydantic import Field
 
+from config.settings import settings
+from src.observability.decorators import trace_tool
 from src.tools.base import BaseTool, ToolInput
 
 
@@ -77,9 +85,126 @@ MOCK_KB_ARTICLES = [
 ]
 
 
+# Intern IDs and categories so lookups against the closed category set
+# compare by identity
+for _article in MOCK_KB_ARTICLES:
+    _article["id"] = sys.intern(_article["id"])
+    _article["category"] = sys.intern(_article["category"])
+del _article
+
+TITLE_MATCH_BOOST = 0.1
+CONTENT_MATCH_BOOST = 0.05
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric words."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams of the normalized text, padded at both ends."""
+    padded = f" {' '.join(_tokenize(text))} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+# Article columns, parallel to MOCK_KB_ARTICLES. Scoring reads these by
+# position instead of going through each article dict.
+BASE_SCORES: Tuple[float, ...] = tuple(a["relevance_score"] for a in MOCK_KB_ARTICLES)
+CATEGORIES: Tuple[str, ...] = tuple(a["category"] for a in MOCK_KB_ARTICLES)
+TITLES_LOWER: Tuple[str, ...] = tuple(a["title"].lower() for a in MOCK_KB_ARTICLES)
+CONTENTS_LOWER: Tuple[str, ...] = tuple(a["content"].lower() for a in MOCK_KB_ARTICLES)
+
+
+def _build_index(field: str) -> Dict[str, FrozenSet[int]]:
+    """Map each trigram in an article field to the positions of articles containing it."""
+    index = defaultdict(set)
+    for i, article in enumerate(MOCK_KB_ARTICLES):
+        for trigram in _trigrams(article[field]):
+            index[trigram].add(i)
+    return {trigram: frozenset(positions) for trigram, positions in index.items()}
+
+
+def _partition_by_category() -> Dict[str, Tuple[int, ...]]:
+    """Group article positions by category, with every article under "all"."""
+    partitions = defaultdict(list)
+    for i, category in enumerate(CATEGORIES):
+        partitions[category].append(i)
+    partitions["all"] = range(len(MOCK_KB_ARTICLES))
+    return {category: tuple(positions) for category, positions in partitions.items()}
+
+
+# Inverted indexes and category partitions over the static corpus,
+# built once at import
+TITLE_INDEX = _build_index("title")
+CONTENT_INDEX = _build_index("content")
+ARTICLES_BY_CATEGORY = _partition_by_category()
+
+
+def _candidates(word: str, index: Dict[str, FrozenSet[int]]) -> Iterable[int]:
+    """
+    Positions of articles that may contain ``word`` as a substring.
+
+    An article can only contain the word if it contains every trigram of
+    it, so candidates are the intersection of the word's postings. Words
+    shorter than a trigram can't be narrowed down.
+    """
+    trigrams = {word[i:i + 3] for i in range(len(word) - 2)}
+    if not trigrams:
+        return range(len(MOCK_KB_ARTICLES))
+    return frozenset.intersection(*(index.get(trigram, frozenset()) for trigram in trigrams))
+
+
+@lru_cache(maxsize=512)
+def _search(query: str, category: str, max_results: int) -> Tuple[Tuple[float, int], ...]:
+    """
+    Rank articles for a normalized query.
+
+    The corpus is static, so results are cached per query, category and
+    limit.
+
+    Args:
+        query: Query words, lowercased and space-separated
+        category: Category filter
+        max_results: Maximum results to return
+
+    Returns:
+        (relevance, article position) pairs, best first
+    """
+    # Keyword matching for relevance: each query word found in an article's
+    # title or content adds a fixed boost. The trigram indexes narrow each
+    # word to the few articles that can contain it before the substring
+    # check, instead of scanning every article's text.
+    # Boosts are added onto the base score one at a time, in the same order
+    # as a linear scan would, so float sums and tie-breaks match it exactly
+    relevance = {}
+    for word in query.split():
+        for i in _candidates(word, TITLE_INDEX):
+            if word in TITLES_LOWER[i]:
+                relevance[i] = relevance.get(i, BASE_SCORES[i]) + TITLE_MATCH_BOOST
+        for i in _candidates(word, CONTENT_INDEX):
+            if word in CONTENTS_LOWER[i]:
+                relevance[i] = relevance.get(i, BASE_SCORES[i]) + CONTENT_MATCH_BOOST
+
+    scored = [
+        (relevance.get(i, BASE_SCORES[i]), i)
+        for i in ARTICLES_BY_CATEGORY.get(category, ())
+    ]
+
+    # Top results by relevance, without sorting the whole category
+    return tuple(heapq.nlargest(max_results, scored, key=itemgetter(0)))
+
+
 class KnowledgeBaseTool(BaseTool):
     """Mock knowledge base search tool."""
 
+    # Cheap, high-volume lookups, so only a sample of calls get a span
+    execute = trace_tool("knowledge_base", sample=settings.tool_trace_sample_rate)(
+        BaseTool.execute.__wrapped__
+    )
+
     def __init__(self):
         super().__init__(
             name="knowledge_base",
@@ -96,36 +221,16 @@ class KnowledgeBaseTool(BaseTool):
         Returns:
             Search results
         """
-        query = input_data.query.lower()
-        category = input_data.category
+        category = sys.intern(input_data.category)
         max_results = input_data.max_results
 
-        # Filter by category
-        articles = MOCK_KB_ARTICLES
-        if category != "all":
-            articles = [a for a in articles if a["category"] == category]
-
-        # Simple keyword matching for relevance
-        results = []
-        for article in articles:
-            # Check if any query words are in title or content
-            title_lower = article["title"].lower()
-            content_lower = article["content"].lower()
-
-            relevance = article["relevance_score"]
-            for word in query.split():
-                if word in title_lower:
-                    relevance += 0.1
-                if word in content_lower:
-                    relevance += 0.05
-
-            results.append({**article, "relevance_score": relevance})
-
-        # Sort by relevance
-        results.sort(key=lambda x: x["relevance_score"], reverse=True)
+        winners = _search(" ".join(_tokenize(input_data.query)), category, max_results)
 
-        # Limit results
-        results = results[:max_results]
+        # Only the winners are copied into result dicts
+        results = [
+            {**MOCK_KB_ARTICLES[i], "relevance_score": relevance}
+            for relevance, i in winners
+        ]
 
         return {
             "found": len(results) > 0,
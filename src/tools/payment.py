@@ -2,11 +2,16 @@
 Mock payment gateway tool for refunds and transactions.
 """
 
-from typing import Any, Dict
+import asyncio
+import itertools
+from typing import Any, Dict, Iterator, Optional
+import httpx
 from pydantic import Field
 import random
 
+from config.settings import settings
 from src.tools.base import BaseTool, ToolInput
+from src.utils.cache import TTLCache
 
 
 class RefundInput(ToolInput):
@@ -25,14 +30,60 @@ class PaymentQueryInput(ToolInput):
     customer_id: str = Field(..., description="Customer identifier")
 
 
+# Simulated gateway outcomes (~10% failures), drawn once at import and
+# cycled through so refunds don't call into the RNG
+_REFUND_OUTCOMES = tuple(random.random() > 0.1 for _ in range(4096))
+_refund_outcomes = itertools.cycle(_REFUND_OUTCOMES)
+
+# Refund ID sequence
+_refund_counter = itertools.count(1000)
+
+# Recent payment lookups. Statuses change rarely within the TTL, and
+# agents often look up the same payment more than once per ticket.
+_query_cache = TTLCache(
+    maxsize=settings.payment_query_cache_max_size,
+    ttl=settings.payment_query_cache_ttl_seconds,
+)
+
+# In-flight fetch per key, so concurrent lookups of one payment share it
+# (and its failure, if it fails)
+_query_in_flight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+def _forget_query(key: str, fetch: "asyncio.Future[Dict[str, Any]]") -> None:
+    """Drop a finished fetch, so the next lookup hits the cache or fetches again."""
+    if _query_in_flight.get(key) is fetch:
+        del _query_in_flight[key]
+
+
 class PaymentTool(BaseTool):
     """Mock payment gateway tool."""
 
-    def __init__(self):
+    # Operation handler per input type
+    _HANDLERS: Dict[type, str] = {
+        RefundInput: "_process_refund",
+        PaymentQueryInput: "_query_payment",
+    }
+
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        refund_outcomes: Optional[Iterator[bool]] = None,
+    ):
+        """
+        Initialize tool.
+
+        Args:
+            http_client: Shared HTTP client for calls to the real service
+            refund_outcomes: Simulated gateway outcomes, True for success
+                (default: the process-wide outcome cycle)
+        """
         super().__init__(
             name="payment_gateway",
             description="Process refunds and query payment status",
         )
+        self.http_client = http_client
+        self._refund_outcomes = refund_outcomes if refund_outcomes is not None else _refund_outcomes
 
     async def _execute(self, input_data: ToolInput) -> Dict[str, Any]:
         """
@@ -44,23 +95,21 @@ class PaymentTool(BaseTool):
         Returns:
             Operation result
         """
-        if isinstance(input_data, RefundInput):
-            return await self._process_refund(input_data)
-        elif isinstance(input_data, PaymentQueryInput):
-            return await self._query_payment(input_data)
-        else:
+        handler_name = self._HANDLERS.get(type(input_data))
+        if handler_name is None:
             return {
                 "success": False,
                 "error": "Unknown payment operation",
             }
+        return await getattr(self, handler_name)(input_data)
 
     async def _process_refund(self, input_data: RefundInput) -> Dict[str, Any]:
         """Process a refund."""
         # Simulate success most of the time
-        success = random.random() > 0.1  # 90% success rate
+        success = next(self._refund_outcomes)
 
         if success:
-            refund_id = f"REF-{random.randint(1000, 9999)}"
+            refund_id = f"REF-{next(_refund_counter)}"
             return {
                 "success": True,
                 "refund_id": refund_id,
@@ -79,7 +128,29 @@ class PaymentTool(BaseTool):
             }
 
     async def _query_payment(self, input_data: PaymentQueryInput) -> Dict[str, Any]:
-        """Query payment status."""
+        """Query payment status, through the lookup cache."""
+        key = f"{input_data.customer_id}:{input_data.payment_id}"
+        result = _query_cache.get(key)
+
+        if result is None:
+            fetch = _query_in_flight.get(key)
+            if fetch is None:
+                fetch = asyncio.ensure_future(self._fetch_and_cache(key, input_data))
+                _query_in_flight[key] = fetch
+                fetch.add_done_callback(lambda done: _forget_query(key, done))
+            # Shielded so one cancelled caller doesn't cancel the shared fetch
+            result = await asyncio.shield(fetch)
+
+        return dict(result)
+
+    async def _fetch_and_cache(self, key: str, input_data: PaymentQueryInput) -> Dict[str, Any]:
+        """Fetch a payment and cache the result."""
+        result = await self._fetch_payment(input_data)
+        _query_cache.set(key, result)
+        return result
+
+    async def _fetch_payment(self, input_data: PaymentQueryInput) -> Dict[str, Any]:
+        """Fetch payment status from the gateway."""
         # Mock payment data
         return {
             "found": True,
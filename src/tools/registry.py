@@ -2,7 +2,13 @@
 Tool registry for managing and discovering available tools.
 """
 
-from typing import Dict, List, Optional, Type
+import asyncio
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+
+import httpx
+
+from config.settings import settings
 from src.tools.base import BaseTool
 from src.tools.database import DatabaseTool, DatabaseQueryInput
 from src.tools.payment import PaymentTool, RefundInput, PaymentQueryInput
@@ -20,16 +26,37 @@ class ToolRegistry:
     Provides tool discovery, registration, and execution.
     """
 
+    # Map agent types to relevant tools
+    AGENT_TOOL_MAPPING: Dict[str, Tuple[str, ...]] = {
+        "billing": ("database_query", "payment_gateway", "email_sender"),
+        "technical": ("database_query", "knowledge_base", "email_sender"),
+        "account": ("database_query", "email_sender"),
+        "escalation": ("database_query", "payment_gateway", "knowledge_base", "email_sender"),
+        "triage": ("database_query",),  # Triage mainly needs customer context
+    }
+
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
+        self._agent_tool_cache: Dict[str, Tuple[BaseTool, ...]] = {}
+        self._initialized = False
+        self._warmup_task: Optional[asyncio.Task] = None
+        # One connection pool shared by every tool that calls out over HTTP
+        self._http_client = httpx.AsyncClient(
+            timeout=settings.tool_http_timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=settings.tool_http_max_connections,
+                max_keepalive_connections=settings.tool_http_max_keepalive_connections,
+                keepalive_expiry=30,
+            ),
+        )
         self._initialize_default_tools()
 
     def _initialize_default_tools(self) -> None:
         """Initialize default tools."""
         default_tools = [
             DatabaseTool(),
-            PaymentTool(),
-            EmailTool(),
+            PaymentTool(http_client=self._http_client),
+            EmailTool(http_client=self._http_client),
             KnowledgeBaseTool(),
         ]
 
@@ -49,6 +76,7 @@ class ToolRegistry:
             logger.warning("tool_already_registered", tool_name=tool.name)
         else:
             self._tools[tool.name] = tool
+            self._build_agent_tool_cache()
             logger.info("tool_registered", tool_name=tool.name)
 
     def unregister(self, tool_name: str) -> bool:
@@ -63,6 +91,7 @@ class ToolRegistry:
         """
         if tool_name in self._tools:
             del self._tools[tool_name]
+            self._build_agent_tool_cache()
             logger.info("tool_unregistered", tool_name=tool_name)
             return True
         return False
@@ -88,7 +117,14 @@ class ToolRegistry:
         """
         return [tool.to_dict() for tool in self._tools.values()]
 
-    def get_tools_for_agent(self, agent_type: str) -> List[BaseTool]:
+    def _build_agent_tool_cache(self) -> None:
+        """Resolve each agent type's registered tools after a registry change."""
+        self._agent_tool_cache = {
+            agent_type: tuple(self._tools[name] for name in tool_names if name in self._tools)
+            for agent_type, tool_names in self.AGENT_TOOL_MAPPING.items()
+        }
+
+    def get_tools_for_agent(self, agent_type: str) -> Tuple[BaseTool, ...]:
         """
         Get tools appropriate for a specific agent type.
 
@@ -96,21 +132,43 @@ class ToolRegistry:
             agent_type: Type of agent (billing, technical, account, etc.)
 
         Returns:
-            List of tools
+            Tuple of tools
         """
-        # Map agent types to relevant tools
-        agent_tool_mapping = {
-            "billing": ["database_query", "payment_gateway", "email_sender"],
-            "technical": ["database_query", "knowledge_base", "email_sender"],
-            "account": ["database_query", "email_sender"],
-            "escalation": ["database_query", "payment_gateway", "knowledge_base", "email_sender"],
-            "triage": ["database_query"],  # Triage mainly needs customer context
-        }
+        return self._agent_tool_cache.get(agent_type, ())
+
+    async def ensure_initialized(self) -> None:
+        """
+        Warm up all registered tools concurrently, once.
+
+        Concurrent callers share one warmup. If it fails, every caller sees
+        the error and the next call tries again.
+        """
+        if self._initialized:
+            return
+
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self._warmup())
+
+        task = self._warmup_task
+        try:
+            # Shielded so a cancelled caller doesn't cancel the others' warmup
+            await asyncio.shield(task)
+        except BaseException:
+            if task.done() and self._warmup_task is task:
+                self._warmup_task = None
+            raise
 
-        tool_names = agent_tool_mapping.get(agent_type, [])
-        tools = [self._tools[name] for name in tool_names if name in self._tools]
+        self._initialized = True
+        self._warmup_task = None
 
-        return tools
+    async def _warmup(self) -> None:
+        """Warm up every registered tool."""
+        await asyncio.gather(*(tool.warmup() for tool in self._tools.values()))
+        logger.info("tool_registry_warmed_up", tool_count=len(self._tools))
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http_client.aclose()
 
     def __len__(self) -> int:
         """Get number of registered tools."""
@@ -121,18 +179,21 @@ class ToolRegistry:
         return tool_name in self._tools
 
 
-# Global registry instance
-_registry: Optional[ToolRegistry] = None
-
-
+@lru_cache(maxsize=1)
 def get_tool_registry() -> ToolRegistry:
     """
     Get the global tool registry instance.
 
+    Call ``get_tool_registry.cache_clear()`` to start over with a fresh
+    registry (e.g. in tests).
+
     Returns:
         Tool registry
     """
-    global _registry
-    if _registry is None:
-        _registry = ToolRegistry()
-    return _registry
+    return ToolRegistry()
+
+
+async def close_tool_registry() -> None:
+    """Release the global registry's connections, if it was created."""
+    if get_tool_registry.cache_info().currsize:
+        await get_tool_registry().aclose()
@@ -0,0 +1,26 @@
+"""
+Shared fixtures for all tests.
+"""
+
+import pytest
+
+from src.orchestration.cache import get_node_cache
+from src.tools.payment import _query_cache, _query_in_flight
+
+
+@pytest.fixture(autouse=True)
+def clear_node_cache():
+    """Start each test with an empty node cache, so no test sees another's results."""
+    get_node_cache().clear()
+    yield
+    get_node_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_payment_query_cache():
+    """Start each test with no cached or in-flight payment lookups."""
+    _query_cache.clear()
+    _query_in_flight.clear()
+    yield
+    _query_cache.clear()
+    _query_in_flight.clear()
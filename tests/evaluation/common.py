@@ -0,0 +1,228 @@
+"""
+Shared evaluation driver.
+
+A workflow run's final state carries both the routing decision and the
+tool calls, so one run per test case can feed every evaluation metric.
+"""
+
+import asyncio
+import copy
+import functools
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    from tqdm.asyncio import tqdm as atqdm
+except ImportError:  # pragma: no cover - optional dependency
+    atqdm = None
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.orchestration.cache import get_node_cache
+from src.orchestration.graph import process_ticket
+from src.observability.context import set_correlation_id
+
+# Maximum tickets in flight at once, to stay clear of provider rate limits
+EVAL_CONCURRENCY = int(os.getenv("EVAL_CONCURRENCY", "8"))
+
+# Scored view of the final state per (dataset_file, test_id), so overall
+# suites reuse the category suites' runs instead of running every ticket
+# again. Cleared by reset_eval_state() at the start of each evaluation run.
+_state_cache: Dict[Tuple[str, str], dict] = {}
+
+
+def reset_eval_state() -> None:
+    """
+    Forget earlier workflow runs, so the next suites run every ticket fresh.
+
+    Clears the evaluation state cache and the workflow's node cache.
+    """
+    _state_cache.clear()
+    get_node_cache().clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_dataset(dataset_file: str) -> tuple:
+    """Parse a dataset file once per process (with orjson if installed)."""
+    dataset_path = Path(__file__).parent / "datasets" / dataset_file
+    data = dataset_path.read_bytes()
+    test_cases = orjson.loads(data) if orjson else json.loads(data)
+
+    # Build each case's expected tool set once, for every evaluation run
+    for tc in test_cases:
+        tc["_expected_tool_set"] = frozenset(tc.get("expected_tools", ()))
+
+    return tuple(test_cases)
+
+
+def load_test_cases(dataset_file: str) -> list:
+    """Load test cases from dataset file."""
+    # Category and overall tests share datasets; only the first load parses.
+    # Callers get copies, so they can't alter the cached cases.
+    return copy.deepcopy(list(_read_dataset(dataset_file)))
+
+
+async def run_ticket_through_workflow(test_case: dict) -> dict:
+    """Run a single test case through the workflow."""
+    set_correlation_id(f"EVAL-{test_case['test_id']}")
+
+    state = await process_ticket(
+        ticket_id=f"T-{test_case['test_id']}",
+        correlation_id=f"EVAL-{test_case['test_id']}",
+        customer_id=test_case["customer_id"],
+        subject=test_case["subject"],
+        body=test_case["input"],
+        email=test_case.get("email", "test@example.com"),
+    )
+
+    return state
+
+
+def _scored_view(state: dict) -> dict:
+    """
+    Keep only the parts of a final state that the metrics read.
+
+    Full states carry prompts, responses and token usage; dropping them as
+    each run completes keeps memory per case small on large suites.
+    """
+    view = {
+        "agent_interactions": [
+            {
+                "agent_name": interaction.get("agent_name"),
+                "tool_calls": [
+                    {"tool": tool_call.get("tool", "unknown"), "success": tool_call.get("success", False)}
+                    for tool_call in interaction.get("tool_calls", [])
+                ],
+            }
+            for interaction in state.get("agent_interactions", [])
+        ],
+    }
+
+    routing = state.get("routing")
+    if routing is not None:
+        view["routing"] = {
+            key: routing[key] for key in ("assigned_agent", "confidence_score") if key in routing
+        }
+
+    if "eval_error" in state:
+        view["eval_error"] = state["eval_error"]
+
+    return view
+
+
+def _failed_state(test_case: dict, error: BaseException) -> dict:
+    """Stand-in final state for a test case whose workflow run raised."""
+    return {
+        "ticket_id": f"T-{test_case['test_id']}",
+        "routing": {"assigned_agent": "error"},
+        "resolution": {
+            "status": "error",
+            "response": f"Workflow failed: {error!r}",
+            "requires_human": True,
+        },
+        "agent_interactions": [],
+        "metadata": {"error_count": 1},
+        "eval_error": repr(error),
+    }
+
+
+async def run_test_cases(
+    test_cases: list,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    desc: Optional[str] = None,
+) -> list:
+    """
+    Run test cases through the workflow concurrently.
+
+    A case whose run raises gets a stand-in state (with ``eval_error`` set)
+    that scores as a miss, so one failure doesn't discard the other
+    results. Shows a progress bar if tqdm is installed.
+
+    Args:
+        test_cases: Test cases to run
+        semaphore: Limits tickets in flight (default: EVAL_CONCURRENCY)
+        desc: Progress bar label
+
+    Returns:
+        Scored views of the final states (see _scored_view), in the same
+        order as test_cases
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(EVAL_CONCURRENCY)
+
+    async def run_bounded(test_case: dict) -> dict:
+        async with semaphore:
+            return await run_ticket_through_workflow(test_case)
+
+    async def run_isolated(test_case: dict) -> dict:
+        try:
+            return _scored_view(await run_bounded(test_case))
+        except Exception as e:
+            return _scored_view(_failed_state(test_case, e))
+
+    runs = (run_isolated(tc) for tc in test_cases)
+    if atqdm is not None:
+        states = await atqdm.gather(*runs, desc=desc, total=len(test_cases))
+    else:
+        states = await asyncio.gather(*runs)
+
+    failed = sum(1 for state in states if "eval_error" in state)
+    if failed:
+        print(f"Processed {len(states)} tickets ({failed} failed)")
+    else:
+        print(f"Processed {len(states)} tickets ✓")
+    return states
+
+
+async def run_eval_suite(
+    dataset_files: List[str],
+    metrics: List[Any],
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> List[dict]:
+    """
+    Run datasets through the workflow once and evaluate every metric.
+
+    Test cases already run since the last reset_eval_state() reuse their
+    final state.
+
+    Args:
+        dataset_files: Dataset files to evaluate together
+        metrics: Metrics with evaluate() and get_summary()
+        semaphore: Limits tickets in flight (default: EVAL_CONCURRENCY)
+
+    Returns:
+        Each metric's results, in the same order as metrics
+    """
+    test_cases = []
+    keys = []
+    for dataset_file in dataset_files:
+        for tc in load_test_cases(dataset_file):
+            test_cases.append(tc)
+            keys.append((dataset_file, tc["test_id"]))
+
+    actual_results = [_state_cache.get(key) for key in keys]
+    pending = [i for i, state in enumerate(actual_results) if state is None]
+    if pending:
+        desc = ", ".join(Path(dataset_file).stem for dataset_file in dataset_files)
+        states = await run_test_cases([test_cases[i] for i in pending], semaphore, desc=desc)
+        for i, state in zip(pending, states):
+            actual_results[i] = state
+            # Failed runs are retried by later suites rather than reused
+            if "eval_error" not in state:
+                _state_cache[keys[i]] = state
+
+    all_results = []
+    for metric in metrics:
+        results = metric.evaluate(test_cases, actual_results)
+        print(metric.get_summary(results))
+        all_results.append(results)
+
+    return all_results
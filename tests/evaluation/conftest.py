@@ -0,0 +1,13 @@
+"""
+Shared fixtures for evaluation tests.
+"""
+
+import pytest
+
+from tests.evaluation.common import reset_eval_state
+
+
+@pytest.fixture(autouse=True)
+def fresh_eval_state():
+    """Run every evaluation test's tickets through the workflow afresh."""
+    reset_eval_state()
@@ -4,6 +4,10 @@ Routing Accuracy Metric.
 Evaluates whether the triage agent routes tickets to the correct specialist agent.
 """
 
+import io
+import operator
+from collections import Counter
+from itertools import chain
 from typing import Dict, Any, List, Optional
 
 
@@ -41,60 +45,52 @@ class RoutingAccuracyMetric:
         Returns:
             Evaluation results with accuracy, precision, recall, per-agent metrics
         """
-        self.results = []
-        correct = 0
         total = len(test_cases)
 
-        # Per-agent tracking
-        agent_stats: Dict[str, Dict[str, int]] = {}
+        # Aligned columns of expected and actual agents
+        routings = [actual.get("routing", {}) for actual in actual_results]
+        expected_agents = [tc["expected_routing"]["assigned_agent"] for tc in test_cases]
+        actual_agents = [routing.get("assigned_agent", "unknown") for routing in routings]
+        correct_mask = list(map(operator.eq, expected_agents, actual_agents))
 
-        for test_case, actual in zip(test_cases, actual_results):
-            expected_agent = test_case["expected_routing"]["assigned_agent"]
-            actual_agent = actual.get("routing", {}).get("assigned_agent", "unknown")
-
-            is_correct = expected_agent == actual_agent
-
-            if is_correct:
-                correct += 1
-
-            # Track per-agent stats
-            if expected_agent not in agent_stats:
-                agent_stats[expected_agent] = {
-                    "true_positive": 0,
-                    "false_positive": 0,
-                    "false_negative": 0,
-                }
-
-            if actual_agent not in agent_stats:
-                agent_stats[actual_agent] = {
-                    "true_positive": 0,
-                    "false_positive": 0,
-                    "false_negative": 0,
-                }
-
-            if is_correct:
-                agent_stats[expected_agent]["true_positive"] += 1
-            else:
-                agent_stats[expected_agent]["false_negative"] += 1
-                agent_stats[actual_agent]["false_positive"] += 1
-
-            self.results.append({
+        self.results = [
+            {
                 "test_id": test_case.get("test_id", "unknown"),
                 "expected": expected_agent,
                 "actual": actual_agent,
                 "correct": is_correct,
-                "confidence": actual.get("routing", {}).get("confidence_score", 0.0),
-            })
+                "confidence": routing.get("confidence_score", 0.0),
+            }
+            for test_case, routing, expected_agent, actual_agent, is_correct in zip(
+                test_cases, routings, expected_agents, actual_agents, correct_mask
+            )
+        ]
+
+        # Per-agent tracking, from the confusion counts of each distinct
+        # (expected, actual) pair
+        confusion = Counter(zip(expected_agents, actual_agents))
+        true_positive: Counter = Counter()
+        false_positive: Counter = Counter()
+        false_negative: Counter = Counter()
+
+        for (expected_agent, actual_agent), count in confusion.items():
+            if expected_agent == actual_agent:
+                true_positive[expected_agent] += count
+            else:
+                false_negative[expected_agent] += count
+                false_positive[actual_agent] += count
 
         # Calculate overall metrics
+        correct = sum(correct_mask)
         accuracy = correct / total if total > 0 else 0.0
 
-        # Calculate per-agent precision and recall
+        # Calculate per-agent precision and recall, for every agent that was
+        # expected or predicted
         agent_metrics = {}
-        for agent, stats in agent_stats.items():
-            tp = stats["true_positive"]
-            fp = stats["false_positive"]
-            fn = stats["false_negative"]
+        for agent in dict.fromkeys(chain.from_iterable(confusion)):
+            tp = true_positive[agent]
+            fp = false_positive[agent]
+            fn = false_negative[agent]
 
             precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
             recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
@@ -130,30 +126,35 @@ class RoutingAccuracyMetric:
         Returns:
             Formatted summary string
         """
-        summary = [
-            f"\n{'='*60}",
-            f"  {self.name}",
-            f"{'='*60}",
-            f"\nOverall Accuracy: {results['accuracy']:.1%} ({results['correct']}/{results['total']})",
-            f"Threshold: {results['threshold']:.1%}",
-            f"Status: {'✅ PASSED' if results['passed'] else '❌ FAILED'}",
-            f"\nPer-Agent Metrics:",
-        ]
+        summary = io.StringIO()
+        write = summary.write
+
+        write(
+            f"\n{'='*60}\n"
+            f"  {self.name}\n"
+            f"{'='*60}\n"
+            f"\nOverall Accuracy: {results['accuracy']:.1%} ({results['correct']}/{results['total']})\n"
+            f"Threshold: {results['threshold']:.1%}\n"
+            f"Status: {'✅ PASSED' if results['passed'] else '❌ FAILED'}\n"
+            f"\nPer-Agent Metrics:\n"
+        )
 
         for agent, metrics in results["agent_metrics"].items():
-            summary.append(f"\n  {agent}:")
-            summary.append(f"    Precision: {metrics['precision']:.1%}")
-            summary.append(f"    Recall: {metrics['recall']:.1%}")
-            summary.append(f"    F1 Score: {metrics['f1_score']:.3f}")
-            summary.append(f"    TP: {metrics['true_positive']}, FP: {metrics['false_positive']}, FN: {metrics['false_negative']}")
+            write(
+                f"\n  {agent}:\n"
+                f"    Precision: {metrics['precision']:.1%}\n"
+                f"    Recall: {metrics['recall']:.1%}\n"
+                f"    F1 Score: {metrics['f1_score']:.3f}\n"
+                f"    TP: {metrics['true_positive']}, FP: {metrics['false_positive']}, FN: {metrics['false_negative']}\n"
+            )
 
         # Show failures
         failures = [r for r in results["details"] if not r["correct"]]
         if failures:
-            summary.append(f"\n\nRouting Failures ({len(failures)}):")
+            write(f"\n\nRouting Failures ({len(failures)}):\n")
             for failure in failures[:10]:  # Show first 10
-                summary.append(f"  - {failure['test_id']}: Expected {failure['expected']}, got {failure['actual']} (conf: {failure['confidence']:.2f})")
+                write(f"  - {failure['test_id']}: Expected {failure['expected']}, got {failure['actual']} (conf: {failure['confidence']:.2f})\n")
 
-        summary.append(f"\n{'='*60}\n")
+        write(f"\n{'='*60}\n")
 
-        return "\n".join(summary)
+        return summary.getvalue()
@@ -4,7 +4,37 @@ Tool Usage Metric.
 Evaluates whether agents call the correct tools for each scenario.
 """
 
-from typing import Dict, Any, List, Optional, Set
+import io
+import math
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+
+def _score_tools(num_expected: int, num_actual: int, num_matched: int) -> Tuple[float, float, float]:
+    """
+    Score one case's tool calls from its set sizes.
+
+    Returns:
+        Tuple of (precision, recall, F1 score)
+    """
+    # Calculate precision: how many of the called tools were expected?
+    if num_actual > 0:
+        tool_precision = num_matched / num_actual
+    else:
+        tool_precision = 0.0 if num_expected > 0 else 1.0
+
+    # Calculate recall: how many of the expected tools were called?
+    if num_expected > 0:
+        tool_recall = num_matched / num_expected
+    else:
+        tool_recall = 1.0
+
+    # F1 score
+    if tool_precision + tool_recall > 0:
+        f1_score = 2 * (tool_precision * tool_recall) / (tool_precision + tool_recall)
+    else:
+        f1_score = 0.0
+
+    return tool_precision, tool_recall, f1_score
 
 
 class ToolUsageMetric:
@@ -46,9 +76,15 @@ class ToolUsageMetric:
         self.results = []
         correct = 0
         total = len(test_cases)
+        precisions: List[float] = []
+        recalls: List[float] = []
+        f1_scores: List[float] = []
 
         for test_case, actual in zip(test_cases, actual_results):
-            expected_tools = set(test_case.get("expected_tools", []))
+            # Precomputed by the dataset loader when available
+            expected_tools = test_case.get("_expected_tool_set")
+            if expected_tools is None:
+                expected_tools = frozenset(test_case.get("expected_tools", ()))
 
             # Extract tools from agent interactions
             actual_tools: Set[str] = set()
@@ -64,27 +100,13 @@ class ToolUsageMetric:
                         "success": tool_call.get("success", False),
                     })
 
-            # Check if expected tools are a subset of actual tools
-            # (allows for extra tools that might be reasonable)
-            has_required_tools = expected_tools.issubset(actual_tools)
-
-            # Calculate precision: how many of the called tools were expected?
-            if len(actual_tools) > 0:
-                tool_precision = len(expected_tools.intersection(actual_tools)) / len(actual_tools)
-            else:
-                tool_precision = 0.0 if len(expected_tools) > 0 else 1.0
-
-            # Calculate recall: how many of the expected tools were called?
-            if len(expected_tools) > 0:
-                tool_recall = len(expected_tools.intersection(actual_tools)) / len(expected_tools)
-            else:
-                tool_recall = 1.0
-
-            # F1 score
-            if tool_precision + tool_recall > 0:
-                f1_score = 2 * (tool_precision * tool_recall) / (tool_precision + tool_recall)
-            else:
-                f1_score = 0.0
+            # Set arithmetic once per case
+            matched_tools = expected_tools & actual_tools
+            missing_tools = expected_tools - matched_tools
+            unexpected_tools = actual_tools - matched_tools
+            tool_precision, tool_recall, f1_score = _score_tools(
+                len(expected_tools), len(actual_tools), len(matched_tools)
+            )
 
             # Consider correct if F1 >= 0.8 (allows some flexibility)
             is_correct = f1_score >= 0.8
@@ -92,15 +114,16 @@ class ToolUsageMetric:
             if is_correct:
                 correct += 1
 
-            missing_tools = expected_tools - actual_tools
-            unexpected_tools = actual_tools - expected_tools
+            precisions.append(tool_precision)
+            recalls.append(tool_recall)
+            f1_scores.append(f1_score)
 
             self.results.append({
                 "test_id": test_case.get("test_id", "unknown"),
-                "expected_tools": sorted(list(expected_tools)),
-                "actual_tools": sorted(list(actual_tools)),
-                "missing_tools": sorted(list(missing_tools)),
-                "unexpected_tools": sorted(list(unexpected_tools)),
+                "expected_tools": sorted(expected_tools),
+                "actual_tools": sorted(actual_tools),
+                "missing_tools": sorted(missing_tools),
+                "unexpected_tools": sorted(unexpected_tools),
                 "precision": tool_precision,
                 "recall": tool_recall,
                 "f1_score": f1_score,
@@ -112,9 +135,10 @@ class ToolUsageMetric:
         correctness = correct / total if total > 0 else 0.0
 
         # Calculate average precision and recall
-        avg_precision = sum(r["precision"] for r in self.results) / len(self.results) if self.results else 0.0
-        avg_recall = sum(r["recall"] for r in self.results) / len(self.results) if self.results else 0.0
-        avg_f1 = sum(r["f1_score"] for r in self.results) / len(self.results) if self.results else 0.0
+        evaluated = len(self.results)
+        avg_precision = math.fsum(precisions) / evaluated if evaluated else 0.0
+        avg_recall = math.fsum(recalls) / evaluated if evaluated else 0.0
+        avg_f1 = math.fsum(f1_scores) / evaluated if evaluated else 0.0
 
         return {
             "metric_name": self.name,
@@ -139,33 +163,38 @@ class ToolUsageMetric:
         Returns:
             Formatted summary string
         """
-        summary = [
-            f"\n{'='*60}",
-            f"  {self.name}",
-            f"{'='*60}",
-            f"\nOverall Correctness: {results['correctness']:.1%} ({results['correct']}/{results['total']})",
-            f"Threshold: {results['threshold']:.1%}",
-            f"Status: {'✅ PASSED' if results['passed'] else '❌ FAILED'}",
-            f"\nAverage Metrics:",
-            f"  Precision: {results['avg_precision']:.1%}",
-            f"  Recall: {results['avg_recall']:.1%}",
-            f"  F1 Score: {results['avg_f1_score']:.3f}",
-        ]
+        summary = io.StringIO()
+        write = summary.write
+
+        write(
+            f"\n{'='*60}\n"
+            f"  {self.name}\n"
+            f"{'='*60}\n"
+            f"\nOverall Correctness: {results['correctness']:.1%} ({results['correct']}/{results['total']})\n"
+            f"Threshold: {results['threshold']:.1%}\n"
+            f"Status: {'✅ PASSED' if results['passed'] else '❌ FAILED'}\n"
+            f"\nAverage Metrics:\n"
+            f"  Precision: {results['avg_precision']:.1%}\n"
+            f"  Recall: {results['avg_recall']:.1%}\n"
+            f"  F1 Score: {results['avg_f1_score']:.3f}\n"
+        )
 
         # Show failures
         failures = [r for r in results["details"] if not r["correct"]]
         if failures:
-            summary.append(f"\n\nTool Usage Issues ({len(failures)}):")
+            write(f"\n\nTool Usage Issues ({len(failures)}):\n")
             for failure in failures[:10]:  # Show first 10
-                summary.append(f"\n  {failure['test_id']}:")
-                summary.append(f"    Expected: {failure['expected_tools']}")
-                summary.append(f"    Actual: {failure['actual_tools']}")
+                write(
+                    f"\n  {failure['test_id']}:\n"
+                    f"    Expected: {failure['expected_tools']}\n"
+                    f"    Actual: {failure['actual_tools']}\n"
+                )
                 if failure['missing_tools']:
-                    summary.append(f"    Missing: {failure['missing_tools']}")
+                    write(f"    Missing: {failure['missing_tools']}\n")
                 if failure['unexpected_tools']:
-                    summary.append(f"    Unexpected: {failure['unexpected_tools']}")
-                summary.append(f"    F1 Score: {failure['f1_score']:.3f}")
+                    write(f"    Unexpected: {failure['unexpected_tools']}\n")
+                write(f"    F1 Score: {failure['f1_score']:.3f}\n")
 
-        summary.append(f"\n{'='*60}\n")
+        write(f"\n{'='*60}\n")
 
-        return "\n".join(summary)
+        return summary.getvalue()
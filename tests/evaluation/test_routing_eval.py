@@ -5,155 +5,78 @@ Tests the accuracy of the triage agent's routing decisions across all ticket cat
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.orchestration.graph import process_ticket
-from src.observability.context import set_correlation_id
+from tests.evaluation.common import EVAL_CONCURRENCY, reset_eval_state, run_eval_suite
 from tests.evaluation.metrics.routing_accuracy import RoutingAccuracyMetric
 
+# Shared metric instances; each evaluate() call returns fresh results
+ROUTING_METRIC = RoutingAccuracyMetric(threshold=0.9)
+# Lower threshold for edge cases (70%) since they're ambiguous
+EDGE_CASE_ROUTING_METRIC = RoutingAccuracyMetric(threshold=0.7)
+OVERALL_ROUTING_METRIC = RoutingAccuracyMetric(threshold=0.85)
 
-async def load_test_cases(dataset_file: str) -> list:
-    """Load test cases from dataset file."""
-    dataset_path = Path(__file__).parent / "datasets" / dataset_file
-    with open(dataset_path, "r") as f:
-        return json.load(f)
 
-
-async def run_ticket_through_workflow(test_case: dict) -> dict:
-    """Run a single test case through the workflow."""
-    set_correlation_id(f"EVAL-{test_case['test_id']}")
-
-    state = await process_ticket(
-        ticket_id=f"T-{test_case['test_id']}",
-        correlation_id=f"EVAL-{test_case['test_id']}",
-        customer_id=test_case["customer_id"],
-        subject=test_case["subject"],
-        body=test_case["input"],
-        email=test_case.get("email", "test@example.com"),
-    )
-
-    return state
-
-
-async def test_billing_routing():
+async def test_billing_routing(semaphore: Optional[asyncio.Semaphore] = None):
     """Test routing accuracy for billing tickets."""
     print("\n" + "="*60)
     print("  Testing Billing Ticket Routing")
     print("="*60)
 
-    test_cases = await load_test_cases("billing_cases.json")
-    actual_results = []
-
-    for test_case in test_cases:
-        print(f"Processing {test_case['test_id']}...", end=" ")
-        state = await run_ticket_through_workflow(test_case)
-        actual_results.append(state)
-        print("✓")
-
-    metric = RoutingAccuracyMetric(threshold=0.9)
-    results = metric.evaluate(test_cases, actual_results)
-
-    print(metric.get_summary(results))
+    [results] = await run_eval_suite(["billing_cases.json"], [ROUTING_METRIC], semaphore)
 
     return results
 
 
-async def test_technical_routing():
+async def test_technical_routing(semaphore: Optional[asyncio.Semaphore] = None):
     """Test routing accuracy for technical tickets."""
     print("\n" + "="*60)
     print("  Testing Technical Ticket Routing")
     print("="*60)
 
-    test_cases = await load_test_cases("technical_cases.json")
-    actual_results = []
-
-    for test_case in test_cases:
-        print(f"Processing {test_case['test_id']}...", end=" ")
-        state = await run_ticket_through_workflow(test_case)
-        actual_results.append(state)
-        print("✓")
-
-    metric = RoutingAccuracyMetric(threshold=0.9)
-    results = metric.evaluate(test_cases, actual_results)
-
-    print(metric.get_summary(results))
+    [results] = await run_eval_suite(["technical_cases.json"], [ROUTING_METRIC], semaphore)
 
     return results
 
 
-async def test_account_routing():
+async def test_account_routing(semaphore: Optional[asyncio.Semaphore] = None):
     """Test routing accuracy for account tickets."""
     print("\n" + "="*60)
     print("  Testing Account Ticket Routing")
     print("="*60)
 
-    test_cases = await load_test_cases("account_cases.json")
-    actual_results = []
-
-    for test_case in test_cases:
-        print(f"Processing {test_case['test_id']}...", end=" ")
-        state = await run_ticket_through_workflow(test_case)
-        actual_results.append(state)
-        print("✓")
-
-    metric = RoutingAccuracyMetric(threshold=0.9)
-    results = metric.evaluate(test_cases, actual_results)
-
-    print(metric.get_summary(results))
+    [results] = await run_eval_suite(["account_cases.json"], [ROUTING_METRIC], semaphore)
 
     return results
 
 
-async def test_edge_case_routing():
+async def test_edge_case_routing(semaphore: Optional[asyncio.Semaphore] = None):
     """Test routing accuracy for edge case tickets."""
     print("\n" + "="*60)
     print("  Testing Edge Case Ticket Routing")
     print("="*60)
 
-    test_cases = await load_test_cases("edge_cases.json")
-    actual_results = []
-
-    for test_case in test_cases:
-        print(f"Processing {test_case['test_id']}...", end=" ")
-        state = await run_ticket_through_workflow(test_case)
-        actual_results.append(state)
-        print("✓")
-
-    # Lower threshold for edge cases (70%) since they're ambiguous
-    metric = RoutingAccuracyMetric(threshold=0.7)
-    results = metric.evaluate(test_cases, actual_results)
-
-    print(metric.get_summary(results))
+    [results] = await run_eval_suite(["edge_cases.json"], [EDGE_CASE_ROUTING_METRIC], semaphore)
 
     return results
 
 
-async def test_overall_routing():
+async def test_overall_routing(semaphore: Optional[asyncio.Semaphore] = None):
     """Test routing accuracy across all ticket categories."""
     print("\n" + "="*60)
     print("  Testing Overall Routing Accuracy")
     print("="*60)
 
-    all_test_cases = []
-    all_actual_results = []
-
-    # Load all datasets
-    for dataset_file in ["billing_cases.json", "technical_cases.json", "account_cases.json", "edge_cases.json"]:
-        test_cases = await load_test_cases(dataset_file)
-        all_test_cases.extend(test_cases)
-
-        for test_case in test_cases:
-            state = await run_ticket_through_workflow(test_case)
-            all_actual_results.append(state)
-
-    metric = RoutingAccuracyMetric(threshold=0.85)
-    results = metric.evaluate(all_test_cases, all_actual_results)
-
-    print(metric.get_summary(results))
+    # All datasets in one run
+    [results] = await run_eval_suite(
+        ["billing_cases.json", "technical_cases.json", "account_cases.json", "edge_cases.json"],
+        [OVERALL_ROUTING_METRIC],
+        semaphore,
+    )
 
     return results
 
@@ -165,27 +88,43 @@ async def main():
     print("="*60)
 
     try:
-        # Run category-specific tests
-        billing_results = await test_billing_routing()
-        technical_results = await test_technical_routing()
-        account_results = await test_account_routing()
-        edge_results = await test_edge_case_routing()
+        # Start from fresh workflow runs
+        reset_eval_state()
+
+        # Every suite shares one limit on tickets in flight
+        semaphore = asyncio.Semaphore(EVAL_CONCURRENCY)
+
+        # Run category-specific tests concurrently; a failing suite doesn't
+        # discard the others' results
+        suites = ["Billing Routing", "Technical Routing", "Account Routing", "Edge Case Routing"]
+        suite_results = await asyncio.gather(
+            test_billing_routing(semaphore),
+            test_technical_routing(semaphore),
+            test_account_routing(semaphore),
+            test_edge_case_routing(semaphore),
+            return_exceptions=True,
+        )
+
+        # Overall accuracy reuses the category suites' workflow runs
+        suites.append("Overall Routing")
+        try:
+            suite_results.append(await test_overall_routing(semaphore))
+        except Exception as e:
+            suite_results.append(e)
 
         # Summary
         print("\n" + "="*60)
         print("  ROUTING EVALUATION SUMMARY")
-        print("="*60)
-        print(f"\nBilling Routing: {billing_results['accuracy']:.1%} ({'✅ PASSED' if billing_results['passed'] else '❌ FAILED'})")
-        print(f"Technical Routing: {technical_results['accuracy']:.1%} ({'✅ PASSED' if technical_results['passed'] else '❌ FAILED'})")
-        print(f"Account Routing: {account_results['accuracy']:.1%} ({'✅ PASSED' if account_results['passed'] else '❌ FAILED'})")
-        print(f"Edge Case Routing: {edge_results['accuracy']:.1%} ({'✅ PASSED' if edge_results['passed'] else '❌ FAILED'})")
-
-        all_passed = all([
-            billing_results['passed'],
-            technical_results['passed'],
-            account_results['passed'],
-            edge_results['passed']
-        ])
+        print("="*60 + "\n")
+
+        all_passed = True
+        for suite, results in zip(suites, suite_results):
+            if isinstance(results, BaseException):
+                print(f"{suite}: ❌ ERROR: {results!r}")
+                all_passed = False
+                continue
+            print(f"{suite}: {results['accuracy']:.1%} ({'✅ PASSED' if results['passed'] else '❌ FAILED'})")
+            all_passed = all_passed and results['passed']
 
         print(f"\n{'✅ ALL TESTS PASSED!' if all_passed else '❌ SOME TESTS FAILED'}")
         print("="*60 + "\n")
@@ -2,29 +2,38 @@
 Integration tests for API endpoints.
 """
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 
 from src.api.main import app
 
 
 @pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="class")
 class TestTicketAPI:
     """Test suite for ticket API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client."""
-        return TestClient(app)
+    @pytest_asyncio.fixture(scope="class", loop_scope="class")
+    async def client(self):
+        """
+        Create an async test client that calls the app in-process.
 
-    def test_health_endpoint(self, client):
+        Shared by the class: app startup and shutdown run once, not per test.
+        """
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                yield client
+
+    async def test_health_endpoint(self, client):
         """Test health check endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
 
-    def test_create_billing_ticket(self, client):
+    async def test_create_billing_ticket(self, client):
         """Test creating a billing ticket."""
         ticket_data = {
             "customer_id": "C12345",
@@ -33,7 +42,7 @@ class TestTicketAPI:
             "email": "customer@example.com",
         }
 
-        response = client.post("/tickets", json=ticket_data)
+        response = await client.post("/tickets", json=ticket_data)
         assert response.status_code == 200
 
         data = response.json()
@@ -43,7 +52,7 @@ class TestTicketAPI:
         assert "resolution" in data
         assert "agent_interactions" in data
 
-    def test_create_technical_ticket(self, client):
+    async def test_create_technical_ticket(self, client):
         """Test creating a technical support ticket."""
         ticket_data = {
             "customer_id": "C67890",
@@ -52,7 +61,7 @@ class TestTicketAPI:
             "email": "dev@example.com",
         }
 
-        response = client.post("/tickets", json=ticket_data)
+        response = await client.post("/tickets", json=ticket_data)
         assert response.status_code == 200
 
         data = response.json()
@@ -61,7 +70,7 @@ class TestTicketAPI:
             "escalation_agent",
         ]
 
-    def test_create_ticket_with_category_hint(self, client):
+    async def test_create_ticket_with_category_hint(self, client):
         """Test creating a ticket with category hint."""
         ticket_data = {
             "customer_id": "C12345",
@@ -71,15 +80,15 @@ class TestTicketAPI:
             "email": "user@example.com",
         }
 
-        response = client.post("/tickets", json=ticket_data)
+        response = await client.post("/tickets", json=ticket_data)
         assert response.status_code == 200
 
         data = response.json()
         assert "ticket_id" in data
 
-    def test_metrics_endpoint(self, client):
+    async def test_metrics_endpoint(self, client):
         """Test metrics endpoint."""
-        response = client.get("/metrics")
+        response = await client.get("/metrics")
         assert response.status_code == 200
         # Prometheus metrics format
         assert "python_gc_objects_collected_total" in response.text or "TYPE" in response.text
@@ -2,6 +2,8 @@
 Unit tests for Triage Agent.
 """
 
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,16 +15,20 @@ from src.llm.client import LLMResponse
 class TestTriageAgent:
     """Test suite for TriageAgent."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def agent(self):
-        """Create a TriageAgent instance."""
+        """
+        Create a TriageAgent instance shared by the class.
+
+        Tests that execute the agent set their own llm_client.generate mock.
+        """
         with patch("src.agents.triage_agent.get_llm_client"), \
              patch("src.agents.triage_agent.get_tool_registry"):
             agent = TriageAgent()
             agent.llm_client = AsyncMock()
             # Mock tool registry with AsyncMock for tool execution
             mock_tool = AsyncMock()
-            mock_tool.execute = AsyncMock(return_value=AsyncMock(
+            mock_tool.execute = AsyncMock(return_value=SimpleNamespace(
                 success=False,
                 result={"found": False}
             ))
@@ -105,3 +111,14 @@ class TestTriageAgent:
         assert routing["urgency"] == "low"
         assert routing["confidence_score"] == 0.75
         assert "Account update needed" in routing["reasoning"]
+
+    @pytest.mark.asyncio
+    async def test_parse_routing_response_alternate(self, agent):
+        """Test parsing of the alternate agent on low-confidence routing."""
+        response = "ROUTE: billing_agent | URGENCY: medium | CONFIDENCE: 0.55 | ALTERNATE: account_agent | REASONING: Could be either"
+
+        routing = agent._parse_routing_response(response)
+
+        assert routing["assigned_agent"] == "billing_agent"
+        assert routing["alternate_agent"] == "account_agent"
+        assert routing["reasoning"] == "Could be either"
@@ -0,0 +1,90 @@
+"""
+Unit tests for LLM request batching.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.llm.batcher import LLMBatcher
+from src.llm.client import LLMResponse
+
+
+def _respond(requests, agent_name=None):
+    return [
+        LLMResponse(content=r["user_message"].upper(), prompt_tokens=1, completion_tokens=1, model="mock")
+        for r in requests
+    ]
+
+
+@pytest.mark.asyncio
+class TestLLMBatcher:
+    """Test suite for LLMBatcher."""
+
+    async def test_concurrent_requests_share_a_batch(self):
+        """Test requests submitted together go out in one call, in order."""
+        client = AsyncMock()
+        client.generate_batch = AsyncMock(side_effect=_respond)
+        batcher = LLMBatcher(client, agent_name="triage", max_batch_size=8, max_wait=0.05)
+
+        responses = await asyncio.gather(*(batcher.submit("system", f"ticket {i}") for i in range(5)))
+
+        assert client.generate_batch.await_count == 1
+        assert [r.content for r in responses] == [f"TICKET {i}" for i in range(5)]
+
+    async def test_batches_are_capped(self):
+        """Test a burst larger than max_batch_size is split into batches."""
+        client = AsyncMock()
+        client.generate_batch = AsyncMock(side_effect=_respond)
+        batcher = LLMBatcher(client, max_batch_size=2, max_wait=0.05)
+
+        await asyncio.gather(*(batcher.submit("system", str(i)) for i in range(5)))
+
+        assert client.generate_batch.await_count == 3
+
+    async def test_errors_propagate_to_callers(self):
+        """Test a failed batch raises in every waiting caller."""
+        client = AsyncMock()
+        client.generate_batch = AsyncMock(side_effect=RuntimeError("provider down"))
+        batcher = LLMBatcher(client, max_wait=0.01)
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            await batcher.submit("system", "ticket")
+
+    async def test_short_batch_response_fails_leftover_callers(self):
+        """Test callers without a response get an error instead of hanging."""
+        client = AsyncMock()
+        client.generate_batch = AsyncMock(side_effect=lambda requests, agent_name=None: _respond(requests[:1]))
+        batcher = LLMBatcher(client, max_batch_size=2, max_wait=0.05)
+
+        results = await asyncio.gather(
+            batcher.submit("system", "first"),
+            batcher.submit("system", "second"),
+            return_exceptions=True,
+        )
+
+        assert results[0].content == "FIRST"
+        assert isinstance(results[1], RuntimeError)
+
+    async def test_close_cancels_pending_requests(self):
+        """Test close() stops the worker and cancels callers still waiting."""
+        started = asyncio.Event()
+
+        async def hang(requests, agent_name=None):
+            started.set()
+            await asyncio.Event().wait()
+
+        client = AsyncMock()
+        client.generate_batch = AsyncMock(side_effect=hang)
+        batcher = LLMBatcher(client, max_wait=0.01)
+
+        pending = asyncio.ensure_future(batcher.submit("system", "ticket"))
+        await started.wait()
+        worker = batcher._worker
+
+        await batcher.close()
+
+        assert worker.done()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
@@ -8,13 +8,24 @@ from unittest.mock import AsyncMock, patch
 from src.llm.client import MockAnthropicClient, LLMClient, LLMResponse
 
 
+@pytest.fixture(autouse=True, scope="module")
+def no_api_delay():
+    """Skip the mock client's simulated API delay."""
+    async def no_sleep(delay):
+        return None
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.llm.client.asyncio.sleep", no_sleep)
+        yield
+
+
 @pytest.mark.asyncio
 class TestMockAnthropicClient:
     """Test suite for MockAnthropicClient."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
-        """Create a MockAnthropicClient instance."""
+        """Create a MockAnthropicClient instance shared by the class (it tracks no usage)."""
         return MockAnthropicClient(api_key="test-key", model="claude-sonnet-4")
 
     @pytest.mark.asyncio
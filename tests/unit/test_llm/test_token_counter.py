@@ -0,0 +1,75 @@
+"""
+Unit tests for token counting utilities.
+"""
+
+from unittest.mock import patch
+
+from src.llm import token_counter
+from src.llm.token_counter import estimate_tokens, PrefixTokenCache, TokenUsageTracker
+
+
+class TestEstimateTokens:
+    """Test suite for estimate_tokens."""
+
+    def test_heuristic_fallback(self):
+        """Test ~4 characters per token when tiktoken is unavailable."""
+        with patch.object(token_counter, "tiktoken", None):
+            assert estimate_tokens("a" * 40) == 10
+            assert estimate_tokens("") == 1
+
+    def test_repeated_text_is_stable(self):
+        """Test repeated calls return the same (cached) count."""
+        text = "You are a helpful customer support triage agent."
+        assert estimate_tokens(text) == estimate_tokens(text)
+        assert estimate_tokens(text) > 0
+
+
+class TestTokenUsageTracker:
+    """Test suite for TokenUsageTracker."""
+
+    def test_track_and_summary(self):
+        """Test usage accumulates across calls."""
+        tracker = TokenUsageTracker()
+        tracker.track(1000, 500)
+        tracker.track(1000, 500)
+
+        summary = tracker.get_summary()
+
+        assert summary["total_tokens"] == 3000
+        assert summary["total_calls"] == 2
+        assert summary["avg_tokens_per_call"] == 1500
+
+
+class TestPrefixTokenCache:
+    """Test suite for PrefixTokenCache."""
+
+    def test_reuses_shared_prefix(self):
+        """Test only the new suffix is tokenized for a shared prefix."""
+        cache = PrefixTokenCache()
+        system = "System prompt.\n\nMore instructions."
+
+        first = cache.count(system + "\n\nFirst question")
+
+        with patch.object(token_counter, "estimate_tokens", wraps=estimate_tokens) as spy:
+            second = cache.count(system + "\n\nSecond question")
+
+        assert spy.call_count == 1
+        assert first > 0 and second > 0
+
+    def test_respects_maxsize(self):
+        """Test least recently used prefixes are evicted."""
+        cache = PrefixTokenCache(maxsize=2)
+        cache.count("a\n\nb\n\nc")
+
+        assert len(cache._counts) == 2
+
+    def test_keys_identify_the_whole_prefix(self):
+        """Test prefixes with the same characters but different segments don't share counts."""
+        cache = PrefixTokenCache()
+        cache.count("ab")
+
+        with patch.object(token_counter, "estimate_tokens", wraps=estimate_tokens) as spy:
+            cache.count("a\n\nb")
+            cache.count("ab", model="other-model")
+
+        assert spy.call_count == 3
@@ -0,0 +1,40 @@
+"""
+Unit tests for correlation ID context.
+"""
+
+import asyncio
+
+import pytest
+
+from src.observability.context import (
+    get_correlation_id,
+    reset_correlation_id,
+    set_correlation_id,
+)
+
+
+class TestCorrelationId:
+    """Test suite for correlation ID propagation."""
+
+    def test_reset_restores_previous_value(self):
+        """Test the token from set_correlation_id restores the prior ID."""
+        outer = set_correlation_id("CID-outer")
+        inner = set_correlation_id("CID-inner")
+
+        assert get_correlation_id() == "CID-inner"
+        reset_correlation_id(inner)
+        assert get_correlation_id() == "CID-outer"
+        reset_correlation_id(outer)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_their_own_id(self):
+        """Test tasks run with gather don't see each other's IDs."""
+
+        async def run(correlation_id):
+            set_correlation_id(correlation_id)
+            await asyncio.sleep(0)
+            return get_correlation_id()
+
+        results = await asyncio.gather(*(run(f"CID-{i}") for i in range(5)))
+
+        assert results == [f"CID-{i}" for i in range(5)]
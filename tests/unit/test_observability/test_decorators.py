@@ -0,0 +1,51 @@
+"""
+Unit tests for observability decorators.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.observability import decorators
+from src.observability.metrics import registry
+from src.tools.database import DatabaseTool, DatabaseQueryInput
+
+CUSTOMER_INFO_QUERY = DatabaseQueryInput(query_type="customer_info", customer_id="C12345")
+
+
+def _successful_calls(tool_name: str) -> float:
+    """Read the success counter for a tool."""
+    labels = {"tool": tool_name, "status": "success"}
+    return registry.get_sample_value("tool_call_count_total", labels) or 0.0
+
+
+@pytest.mark.asyncio
+class TestTraceToolSampling:
+    """Test suite for trace_tool span sampling."""
+
+    @pytest.fixture
+    def trace_span(self, monkeypatch):
+        """Replace trace_span with a mock."""
+        trace_span = MagicMock()
+        monkeypatch.setattr(decorators, "trace_span", trace_span)
+        return trace_span
+
+    async def test_unsampled_call_skips_span_but_records_metrics(self, trace_span, monkeypatch):
+        """Test a call outside the sample gets no span but still counts."""
+        monkeypatch.setattr(decorators.random, "random", lambda: 0.99)
+        before = _successful_calls("database_query")
+
+        result = await DatabaseTool().execute(CUSTOMER_INFO_QUERY)
+
+        assert result.success is True
+        trace_span.assert_not_called()
+        assert _successful_calls("database_query") == before + 1
+
+    async def test_sampled_call_creates_span(self, trace_span, monkeypatch):
+        """Test a call inside the sample is traced."""
+        monkeypatch.setattr(decorators.random, "random", lambda: 0.0)
+
+        await DatabaseTool().execute(CUSTOMER_INFO_QUERY)
+
+        trace_span.assert_called_once()
+        assert trace_span.call_args.args[0] == "tool.database_query"
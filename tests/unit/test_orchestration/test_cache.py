@@ -0,0 +1,135 @@
+"""
+Unit tests for the agent node cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from config.settings import settings
+from src.orchestration.cache import TTLCache, cached_node, get_node_cache, make_cache_key
+from src.orchestration.state import create_initial_state
+
+
+def _state(ticket_id: str = "T-1", body: str = "I was charged twice") -> dict:
+    return create_initial_state(
+        ticket_id=ticket_id,
+        correlation_id="CID-test",
+        customer_id="C12345",
+        subject="Billing issue",
+        body=body,
+    )
+
+
+async def _fake_triage(state: dict) -> dict:
+    state["routing"] = {"assigned_agent": "billing_agent", "confidence_score": 0.9, "reasoning": "Charge"}
+    state["agent_interactions"].append({
+        "agent_name": "triage_agent",
+        "timestamp": state["timestamp"],
+        "action": "route",
+        "tool_calls": [{"tool": "database_query", "success": True}],
+    })
+    return state
+
+
+@pytest.mark.asyncio
+class TestCachedNode:
+    """Test suite for cached_node."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, monkeypatch):
+        """Turn the cache on (tests start with it empty, see tests/conftest.py)."""
+        monkeypatch.setattr(settings, "node_cache_enabled", True)
+
+    async def test_repeat_ticket_skips_agent(self):
+        """Test a repeat ticket reuses the cached routing."""
+        agent_fn = AsyncMock(side_effect=_fake_triage)
+
+        await cached_node("triage", _state("T-1"), agent_fn)
+        state = _state("T-2")
+        patch = await cached_node("triage", state, agent_fn)
+
+        assert agent_fn.await_count == 1
+        assert patch["routing"]["assigned_agent"] == "billing_agent"
+        assert len(patch["agent_interactions"]) == 1
+        assert patch["agent_interactions"][0]["timestamp"] == state["timestamp"]
+
+    async def test_hit_does_not_replay_tool_calls(self):
+        """Test a cache hit records no tool calls."""
+        agent_fn = AsyncMock(side_effect=_fake_triage)
+
+        await cached_node("triage", _state("T-1"), agent_fn)
+        patch = await cached_node("triage", _state("T-2"), agent_fn)
+
+        assert patch["agent_interactions"][0]["tool_calls"] == []
+
+    async def test_side_effecting_node_always_runs(self):
+        """Test a repeat billing ticket still calls the payment tool."""
+        payment_tool = AsyncMock()
+
+        async def billing(state: dict) -> dict:
+            await payment_tool.execute({"payment_id": "PAY-12345"})
+            state["resolution"] = {"status": "resolved", "response": "Refunded", "requires_human": False}
+            return state
+
+        await cached_node("billing", _state("T-1"), billing)
+        await cached_node("billing", _state("T-2"), billing)
+
+        assert payment_tool.execute.await_count == 2
+        assert len(get_node_cache()) == 0
+
+    async def test_state_is_not_mutated(self):
+        """Test the node returns a patch and leaves the state untouched."""
+        agent_fn = AsyncMock(side_effect=_fake_triage)
+        state = _state()
+        routing = dict(state["routing"])
+
+        patch = await cached_node("triage", state, agent_fn)
+
+        assert state["routing"] == routing
+        assert state["agent_interactions"] == []
+        assert "metadata" not in patch
+
+    async def test_different_ticket_misses(self):
+        """Test a different ticket body runs the agent again."""
+        agent_fn = AsyncMock(side_effect=_fake_triage)
+
+        await cached_node("triage", _state(body="Charged twice"), agent_fn)
+        await cached_node("triage", _state(body="Need an invoice"), agent_fn)
+
+        assert agent_fn.await_count == 2
+
+
+class TestCacheKey:
+    """Test suite for make_cache_key."""
+
+    def test_key_normalizes_whitespace_and_case(self):
+        """Test equivalent tickets produce the same key."""
+        assert make_cache_key("triage", _state(body="Charged  TWICE")) == make_cache_key(
+            "triage", _state(body="charged twice")
+        )
+
+    def test_key_differs_per_node(self):
+        """Test nodes don't share entries."""
+        assert make_cache_key("triage", _state()) != make_cache_key("billing", _state())
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_expired_entries_are_dropped(self):
+        """Test entries past their TTL are not returned."""
+        cache = TTLCache(maxsize=10, ttl=-1)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
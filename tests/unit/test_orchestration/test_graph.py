@@ -0,0 +1,145 @@
+"""
+Unit tests for workflow lookup.
+"""
+
+import asyncio
+
+import pytest
+
+from config.settings import settings
+from src.orchestration import graph
+from src.orchestration.graph import TicketWorkflow, get_workflow, use_workflow, warmup_workflow
+from src.orchestration.pool import AgentPool
+from src.orchestration.state import create_initial_state
+
+
+class TestWorkflowOverride:
+    """Test suite for use_workflow."""
+
+    def test_override_is_scoped(self):
+        """Test the override applies only inside the block."""
+        default = get_workflow()
+        tenant = TicketWorkflow()
+
+        with use_workflow(tenant):
+            assert get_workflow() is tenant
+
+        assert get_workflow() is default
+
+    @pytest.mark.asyncio
+    async def test_override_does_not_leak_across_tasks(self):
+        """Test an override in one task is invisible to another."""
+        tenant = TicketWorkflow()
+        seen = {}
+
+        async def with_override():
+            with use_workflow(tenant):
+                await asyncio.sleep(0.01)
+                seen["inside"] = get_workflow()
+
+        async def without_override():
+            await asyncio.sleep(0)
+            seen["outside"] = get_workflow()
+
+        await asyncio.gather(with_override(), without_override())
+
+        assert seen["inside"] is tenant
+        assert seen["outside"] is not tenant
+
+
+def _low_confidence_state(assigned_agent: str, alternate_agent: str) -> dict:
+    state = create_initial_state(
+        ticket_id="T-1",
+        correlation_id="CID-test",
+        customer_id="C12345",
+        subject="Question",
+        body="Something is wrong",
+    )
+    state["routing"].update(
+        assigned_agent=assigned_agent,
+        alternate_agent=alternate_agent,
+        confidence_score=0.5,
+    )
+    return state
+
+
+def _node(response: str, delay: float = 0.0, error: Exception = None):
+    async def node(state: dict) -> dict:
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return {"resolution": {"status": "resolved", "response": response}}
+    return node
+
+
+@pytest.mark.asyncio
+class TestSpeculativeRouting:
+    """Test suite for speculative specialist dispatch."""
+
+    @pytest.fixture
+    def workflow(self, monkeypatch):
+        """Create a workflow with speculative routing enabled."""
+        monkeypatch.setattr(settings, "speculative_routing_enabled", True)
+        return TicketWorkflow()
+
+    def test_side_effecting_alternate_is_not_speculated(self, workflow):
+        """Test an alternate that can refund or email never runs speculatively."""
+        state = _low_confidence_state("escalation_agent", "billing_agent")
+
+        assert workflow._speculative_nodes(state, "escalation") is None
+
+    def test_side_effect_free_alternate_is_speculated(self, workflow):
+        """Test a read-only alternate runs alongside the primary."""
+        state = _low_confidence_state("technical_agent", "escalation_agent")
+
+        assert workflow._speculative_nodes(state, "technical") == ["technical", "escalation"]
+
+    async def test_primary_wins_even_when_slower(self, workflow):
+        """Test the routed agent's result is used even if the alternate finishes first."""
+        workflow.nodes = {"technical": _node("primary", delay=0.01), "escalation": _node("alternate")}
+        state = _low_confidence_state("technical_agent", "escalation_agent")
+
+        await workflow._execute_speculative(state, ["technical", "escalation"])
+
+        assert state["resolution"]["response"] == "primary"
+        assert state["routing"]["assigned_agent"] == "technical_agent"
+
+    async def test_alternate_used_when_primary_fails(self, workflow):
+        """Test the alternate's result is used, and routed to, if the primary fails."""
+        workflow.nodes = {
+            "technical": _node("primary", error=RuntimeError("down")),
+            "escalation": _node("alternate"),
+        }
+        state = _low_confidence_state("technical_agent", "escalation_agent")
+
+        await workflow._execute_speculative(state, ["technical", "escalation"])
+
+        assert state["resolution"]["response"] == "alternate"
+        assert state["routing"]["assigned_agent"] == "escalation_agent"
+
+
+@pytest.mark.asyncio
+class TestWarmup:
+    """Test suite for warmup_workflow."""
+
+    async def test_constructs_agents_without_running_them(self, monkeypatch):
+        """Test warmup creates every agent but never executes one."""
+        executed = []
+
+        class Agent:
+            async def execute(self, state):
+                executed.append(state)
+                return state
+
+        pools = {}
+
+        def get_agent_pool(name):
+            return pools.setdefault(name, AgentPool(Agent, size=1))
+
+        monkeypatch.setattr(graph, "get_agent_pool", get_agent_pool)
+
+        await warmup_workflow()
+
+        assert sorted(pools) == ["account", "billing", "escalation", "technical", "triage"]
+        assert all(pool._created == 1 for pool in pools.values())
+        assert executed == []
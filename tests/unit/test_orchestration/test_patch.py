@@ -0,0 +1,84 @@
+"""
+Unit tests for node state patches.
+"""
+
+import copy
+
+import pytest
+
+from src.orchestration.patch import apply_patch, overlay, run_agent
+from src.orchestration.state import create_initial_state
+
+
+def _state() -> dict:
+    return create_initial_state(
+        ticket_id="T-1",
+        correlation_id="CID-test",
+        customer_id="C12345",
+        subject="Billing issue",
+        body="I was charged twice",
+    )
+
+
+async def _fake_triage(state: dict) -> dict:
+    state["customer_context"]["tier"] = "pro"
+    state["routing"] = {**state["routing"], "assigned_agent": "billing_agent"}
+    state["metadata"]["token_usage"]["triage"] = {"prompt": 10, "completion": 5}
+    state["agent_interactions"].append({"agent_name": "triage_agent", "action": "route"})
+    return state
+
+
+@pytest.mark.asyncio
+class TestRunAgent:
+    """Test suite for run_agent."""
+
+    async def test_patch_contains_only_changes(self):
+        """Test the patch holds the agent's changes and nothing else."""
+        patch = await run_agent(_state(), _fake_triage)
+
+        assert patch == {
+            "customer_context": {"tier": "pro"},
+            "routing": {"assigned_agent": "billing_agent"},
+            "metadata": {"token_usage": {"triage": {"prompt": 10, "completion": 5}}},
+            "agent_interactions": [{"agent_name": "triage_agent", "action": "route"}],
+        }
+
+    async def test_state_is_not_mutated(self):
+        """Test the agent only sees an overlay of the state."""
+        state = _state()
+        before = copy.deepcopy(state)
+
+        await run_agent(state, _fake_triage)
+
+        assert state == before
+
+
+class TestApplyPatch:
+    """Test suite for apply_patch."""
+
+    def test_merges_dicts_and_appends_interactions(self):
+        """Test nested keys are merged and interactions appended."""
+        state = _state()
+        state["agent_interactions"].append({"agent_name": "triage_agent"})
+
+        apply_patch(state, {
+            "routing": {"assigned_agent": "billing_agent"},
+            "metadata": {"latency_ms": {"billing": 120}},
+            "agent_interactions": [{"agent_name": "billing_agent"}],
+        })
+
+        assert state["routing"]["assigned_agent"] == "billing_agent"
+        assert state["routing"]["urgency"] == "medium"
+        assert state["metadata"]["latency_ms"] == {"billing": 120}
+        assert [i["agent_name"] for i in state["agent_interactions"]] == ["triage_agent", "billing_agent"]
+
+    def test_overlay_isolates_nested_dicts(self):
+        """Test writes two levels down don't reach the original state."""
+        state = _state()
+
+        working = overlay(state)
+        working["metadata"]["latency_ms"]["triage"] = 5
+        working["agent_interactions"].append({})
+
+        assert state["metadata"]["latency_ms"] == {}
+        assert state["agent_interactions"] == []
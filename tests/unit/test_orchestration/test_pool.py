@@ -0,0 +1,56 @@
+"""
+Unit tests for agent pools.
+"""
+
+import asyncio
+
+import pytest
+
+from src.orchestration.pool import AgentPool
+
+
+class _SlowAgent:
+    """Agent that records how many executions overlap."""
+
+    active = 0
+    peak = 0
+
+    async def execute(self, state: dict) -> dict:
+        _SlowAgent.active += 1
+        _SlowAgent.peak = max(_SlowAgent.peak, _SlowAgent.active)
+        await asyncio.sleep(0.01)
+        _SlowAgent.active -= 1
+        state["handled_by"] = id(self)
+        return state
+
+
+@pytest.mark.asyncio
+class TestAgentPool:
+    """Test suite for AgentPool."""
+
+    async def test_concurrency_is_capped(self):
+        """Test no more than size executions run at once."""
+        _SlowAgent.peak = 0
+        pool = AgentPool(_SlowAgent, size=2)
+
+        await asyncio.gather(*(pool.execute({}) for _ in range(6)))
+
+        assert _SlowAgent.peak == 2
+        assert pool.in_use == 0
+
+    async def test_agents_are_reused(self):
+        """Test sequential executions share one instance."""
+        pool = AgentPool(_SlowAgent, size=4)
+
+        first = await pool.execute({})
+        second = await pool.execute({})
+
+        assert first["handled_by"] == second["handled_by"]
+
+    async def test_checkout_is_exclusive(self):
+        """Test concurrent checkouts get distinct agents."""
+        pool = AgentPool(_SlowAgent, size=3)
+
+        results = await asyncio.gather(*(pool.execute({}) for _ in range(3)))
+
+        assert len({r["handled_by"] for r in results}) == 3
@@ -0,0 +1,130 @@
+"""
+Unit tests for the semantic routing cache.
+"""
+
+import sys
+import types
+
+import pytest
+
+from config.settings import settings
+from src.orchestration import semantic_cache
+from src.orchestration.semantic_cache import SemanticRoutingCache, get_semantic_cache
+from src.orchestration.state import create_initial_state
+
+# Unit embeddings per ticket subject. Declined and rejected have cosine
+# similarity 0.95 (a hit); declined and refused 0.8 (a miss).
+EMBEDDINGS = {
+    "Card declined": [1.0, 0.0, 0.0],
+    "Card rejected": [0.95, 0.3122499, 0.0],
+    "Card refused": [0.8, 0.6, 0.0],
+    "Password reset": [0.0, 1.0, 0.0],
+    "Slow dashboard": [0.0, 0.0, 1.0],
+}
+
+
+class StubEncoder:
+    """Stands in for SentenceTransformer, embedding tickets by subject."""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return 3
+
+    def encode(self, text: str, normalize_embeddings: bool = False):
+        import numpy as np
+
+        subject = next(subject for subject in EMBEDDINGS if text.startswith(subject))
+        return np.array(EMBEDDINGS[subject], dtype=np.float64)
+
+
+def _state(subject: str) -> dict:
+    return create_initial_state(
+        ticket_id="T-1",
+        correlation_id="CID-test",
+        customer_id="C12345",
+        subject=subject,
+        body="",
+    )
+
+
+def _routing(agent: str) -> dict:
+    return {"assigned_agent": agent, "confidence_score": 0.9}
+
+
+@pytest.fixture
+def stub_encoder(monkeypatch):
+    """Install StubEncoder as sentence_transformers.SentenceTransformer."""
+    pytest.importorskip("numpy")
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = StubEncoder
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+
+
+async def _add(cache: SemanticRoutingCache, subject: str, agent: str) -> None:
+    _, embedding = await cache.lookup(_state(subject))
+    cache.add(embedding, _routing(agent))
+
+
+@pytest.mark.asyncio
+class TestSemanticRoutingCache:
+    """Test suite for SemanticRoutingCache."""
+
+    async def test_similar_ticket_hits(self, stub_encoder):
+        """Test a ticket above the similarity threshold reuses the routing."""
+        cache = SemanticRoutingCache("stub", threshold=0.92)
+        await _add(cache, "Card declined", "billing_agent")
+
+        routing, _ = await cache.lookup(_state("Card rejected"))
+
+        assert routing == _routing("billing_agent")
+
+    async def test_dissimilar_ticket_misses(self, stub_encoder):
+        """Test a ticket below the similarity threshold misses."""
+        cache = SemanticRoutingCache("stub", threshold=0.92)
+        await _add(cache, "Card declined", "billing_agent")
+
+        routing, _ = await cache.lookup(_state("Card refused"))
+
+        assert routing is None
+
+    async def test_oldest_entry_is_overwritten_at_capacity(self, stub_encoder):
+        """Test adding past max_entries overwrites the oldest decision."""
+        cache = SemanticRoutingCache("stub", max_entries=2)
+        await _add(cache, "Card declined", "billing_agent")
+        await _add(cache, "Password reset", "account_agent")
+        await _add(cache, "Slow dashboard", "technical_agent")
+
+        assert len(cache) == 2
+        assert (await cache.lookup(_state("Card declined")))[0] is None
+        assert (await cache.lookup(_state("Password reset")))[0] == _routing("account_agent")
+        assert (await cache.lookup(_state("Slow dashboard")))[0] == _routing("technical_agent")
+
+    async def test_save_load_round_trip(self, stub_encoder, tmp_path):
+        """Test saved decisions are found by a cache loaded from the same file."""
+        path = tmp_path / "semantic_cache.npz"
+        cache = SemanticRoutingCache("stub", path=str(path))
+        await _add(cache, "Card declined", "billing_agent")
+        cache.save()
+
+        loaded = SemanticRoutingCache("stub", path=str(path))
+        routing, _ = await loaded.lookup(_state("Card rejected"))
+
+        assert len(loaded) == 1
+        assert routing == _routing("billing_agent")
+
+
+class TestGetSemanticCache:
+    """Test suite for get_semantic_cache."""
+
+    def test_missing_dependencies_disable_cache(self, monkeypatch):
+        """Test an ImportError disables the cache instead of failing triage."""
+        monkeypatch.setattr(settings, "semantic_cache_enabled", True)
+        monkeypatch.setattr(semantic_cache, "_semantic_cache", None)
+        monkeypatch.setattr(semantic_cache, "_semantic_cache_unavailable", False)
+        monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+
+        assert get_semantic_cache() is None
+        assert semantic_cache._semantic_cache_unavailable is True
+        assert get_semantic_cache() is None
@@ -0,0 +1,54 @@
+"""
+Unit tests for the agent state schema.
+"""
+
+from datetime import datetime
+
+from src.orchestration.state import AgentState, create_initial_state
+
+
+def _state_dict() -> dict:
+    state = create_initial_state(
+        ticket_id="T-1",
+        correlation_id="CID-test",
+        customer_id="C12345",
+        subject="Billing issue",
+        body="I was charged twice",
+    )
+    state["agent_interactions"].append({
+        "agent_name": "billing_agent",
+        "timestamp": datetime(2024, 1, 1),
+        "action": "resolve",
+        "reasoning": None,
+        "tool_calls": [{"tool": "payment_tool"}],
+        "result": "Refunded",
+    })
+    return state
+
+
+class TestAgentState:
+    """Test suite for AgentState."""
+
+    def test_round_trip(self):
+        """Test to_dict reproduces the dictionary the state was built from."""
+        data = _state_dict()
+
+        assert AgentState.from_dict(data).to_dict() == data
+
+    def test_to_dict_copies_containers(self):
+        """Test mutating the serialized dict leaves the state untouched."""
+        state = AgentState.from_dict(_state_dict())
+
+        data = state.to_dict()
+        data["agent_interactions"][0]["tool_calls"].append({"tool": "email_tool"})
+        data["metadata"]["latency_ms"]["triage"] = 10
+
+        assert len(state.agent_interactions[0].tool_calls) == 1
+        assert state.metadata.latency_ms == {}
+
+    def test_uses_slots(self):
+        """Test state dataclasses don't carry a per-instance __dict__."""
+        state = AgentState.from_dict(_state_dict())
+
+        assert not hasattr(state, "__dict__")
+        assert not hasattr(state.customer_context, "__dict__")
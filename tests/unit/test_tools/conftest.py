@@ -0,0 +1,27 @@
+"""
+Shared fixtures for tool tests.
+"""
+
+from pathlib import Path
+
+import pytest
+from pytest_asyncio import is_async_test
+
+from src.tools.payment import PaymentTool
+
+TOOL_TESTS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """Run the async tool tests on one session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and TOOL_TESTS_DIR in item.path.parents:
+            # Prepended so it takes precedence over the class-level marker
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="module")
+def payment_tool():
+    """Create a PaymentTool instance shared by the module."""
+    return PaymentTool()
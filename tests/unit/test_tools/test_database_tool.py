@@ -11,9 +11,9 @@ from src.tools.database import DatabaseTool, DatabaseQueryInput
 class TestDatabaseTool:
     """Test suite for DatabaseTool."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def tool(self):
-        """Create a DatabaseTool instance."""
+        """Create a DatabaseTool instance shared by the class (queries are read-only)."""
         return DatabaseTool()
 
     @pytest.mark.asyncio
@@ -92,3 +92,29 @@ class TestDatabaseTool:
         assert result.success is True
         assert "error" in result.result
         assert "supported_types" in result.result
+
+    @pytest.mark.asyncio
+    async def test_not_found_result_is_shared(self, tool):
+        """Test repeated misses for the same customer reuse one result."""
+        input_data = DatabaseQueryInput(
+            query_type="customer_info",
+            customer_id="C00404",
+        )
+
+        first = await tool.execute(input_data)
+        second = await tool.execute(input_data)
+
+        assert first.result["found"] is False
+        assert first.result is second.result
+
+    @pytest.mark.asyncio
+    async def test_multi_query(self, tool):
+        """Test batched queries return results in request order."""
+        results = await tool.multi_query([
+            DatabaseQueryInput(query_type="customer_info", customer_id="C12345"),
+            DatabaseQueryInput(query_type="payment_history", customer_id="C12345"),
+        ])
+
+        assert [r.success for r in results] == [True, True]
+        assert results[0].result["customer"]["customer_id"] == "C12345"
+        assert results[1].result["total_count"] == 2
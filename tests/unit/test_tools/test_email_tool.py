@@ -2,71 +2,88 @@
 Unit tests for Email Tool.
 """
 
+import asyncio
+import itertools
+
 import pytest
-from unittest.mock import patch
+from pydantic import ValidationError
 
 from src.tools.email import EmailTool, EmailInput
 
+# Inputs are frozen, so tests share them
+RESOLVED_EMAIL = EmailInput(
+    to="customer@example.com",
+    subject="Your ticket has been resolved",
+    body="Thank you for contacting support. Your issue has been resolved.",
+    template="ticket_resolved",
+)
+TEST_EMAIL = EmailInput(
+    to="customer@example.com",
+    subject="Test email",
+    body="Test body",
+)
+WELCOME_EMAIL = EmailInput(
+    to="test@example.com",
+    subject="Welcome!",
+    body="Welcome to our service",
+    template="welcome",
+)
+
+# First send number for the tool's counter, input and expected result fields
+SEND_CASES = [
+    # The counter's first send succeeds
+    (1, RESOLVED_EMAIL, {"success": True, "recipient": "customer@example.com", "status": "sent"}),
+    # Every 32nd send fails
+    (32, TEST_EMAIL, {"success": False, "retry_recommended": True}),
+    # Custom template
+    (1, WELCOME_EMAIL, {"success": True, "subject": "Welcome!"}),
+]
+
 
 @pytest.mark.asyncio
 class TestEmailTool:
     """Test suite for EmailTool."""
 
-    @pytest.fixture
-    def tool(self):
-        """Create an EmailTool instance."""
-        return EmailTool()
-
-    @pytest.mark.asyncio
-    async def test_send_email_success(self, tool):
-        """Test successful email sending."""
-        # Mock random to always succeed
-        with patch('src.tools.email.random.random', return_value=0.5):
-            input_data = EmailInput(
-                to="customer@example.com",
-                subject="Your ticket has been resolved",
-                body="Thank you for contacting support. Your issue has been resolved.",
-                template="ticket_resolved",
+    async def test_send_email(self):
+        """Test email sending outcomes, run concurrently."""
+        results = await asyncio.gather(
+            *(
+                EmailTool(send_counter=itertools.count(first_send)).execute(input_data)
+                for first_send, input_data, _ in SEND_CASES
             )
+        )
 
-            result = await tool.execute(input_data)
+        for (_, input_data, expected), result in zip(SEND_CASES, results):
+            name = input_data.subject
+            assert result.success is True, name  # Tool execution succeeded
+            assert {key: result.result.get(key) for key in expected} == expected, name
+            if expected["success"]:
+                assert "message_id" in result.result, name
+            else:
+                assert "error" in result.result, name
 
-            assert result.success is True
-            assert result.result["success"] is True
-            assert result.result["recipient"] == "customer@example.com"
-            assert "message_id" in result.result
-            assert result.result["status"] == "sent"
+    def test_input_preview_is_bounded(self):
+        """Test long bodies are truncated in the log preview."""
+        input_data = EmailInput(
+            to="customer@example.com",
+            subject="Update",
+            body="x" * 10_000,
+        )
 
-    @pytest.mark.asyncio
-    async def test_send_email_failure(self, tool):
-        """Test email sending failure."""
-        # Mock random to always fail
-        with patch('src.tools.email.random.random', return_value=0.01):
-            input_data = EmailInput(
-                to="customer@example.com",
-                subject="Test email",
-                body="Test body",
-            )
-
-            result = await tool.execute(input_data)
+        preview = input_data.preview()
 
-            assert result.success is True  # Tool execution succeeded
-            assert result.result["success"] is False  # Email sending failed
-            assert "error" in result.result
-            assert result.result["retry_recommended"] is True
-
-    @pytest.mark.asyncio
-    async def test_email_with_template(self, tool):
-        """Test email with custom template."""
-        with patch('src.tools.email.random.random', return_value=0.5):
-            input_data = EmailInput(
-                to="test@example.com",
-                subject="Welcome!",
-                body="Welcome to our service",
-                template="welcome",
-            )
+        assert len(preview) <= 200
+        assert "to='customer@example.com'" in preview
+        assert "(len=10000)" in preview
 
-            result = await tool.execute(input_data)
+    def test_input_is_frozen_and_strict(self):
+        """Test inputs can't be mutated or given unknown fields."""
+        input_data = EmailInput(to="customer@example.com", subject="Hi", body="Hello")
 
-            assert result.success is True
-            assert result.result["subject"] == "Welcome!"
+        with pytest.raises(ValidationError):
+            input_data.subject = "Changed"
+        with pytest.raises(ValidationError):
+            EmailInput(to="customer@example.com", subject="Hi", body="Hello", cc="x@example.com")
+        assert hash(input_data) == hash(
+            EmailInput(to="customer@example.com", subject="Hi", body="Hello")
+        )
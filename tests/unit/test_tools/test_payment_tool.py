@@ -2,70 +2,76 @@
 Unit tests for Payment Tool.
 """
 
+import asyncio
+import itertools
+
 import pytest
-from unittest.mock import patch
 
+from src.tools.base import ToolInput
 from src.tools.payment import PaymentTool, RefundInput, PaymentQueryInput
 
+# Inputs are frozen, so tests share them
+DUPLICATE_CHARGE_REFUND = RefundInput(
+    payment_id="PAY-12345",
+    customer_id="C12345",
+    amount=49.99,
+    reason="Duplicate charge",
+)
+TEST_REFUND = RefundInput(
+    payment_id="PAY-12345",
+    customer_id="C12345",
+    amount=49.99,
+    reason="Test refund",
+)
+LARGE_REFUND = RefundInput(
+    payment_id="PAY-99999",
+    customer_id="C99999",
+    amount=999.99,
+    reason="Service cancellation",
+)
+PAYMENT_QUERY = PaymentQueryInput(
+    payment_id="PAY-12345",
+    customer_id="C12345",
+)
+
+# Simulated gateway outcome, input and expected result fields
+REFUND_CASES = [
+    (
+        True,
+        DUPLICATE_CHARGE_REFUND,
+        {"success": True, "payment_id": "PAY-12345", "amount": 49.99, "status": "processed"},
+    ),
+    (False, TEST_REFUND, {"success": False, "retry_recommended": True}),
+    # Large amount
+    (True, LARGE_REFUND, {"success": True, "amount": 999.99}),
+]
+
 
 @pytest.mark.asyncio
 class TestPaymentTool:
     """Test suite for PaymentTool."""
 
-    @pytest.fixture
-    def tool(self):
-        """Create a PaymentTool instance."""
-        return PaymentTool()
-
-    @pytest.mark.asyncio
-    async def test_process_refund_success(self, tool):
-        """Test successful refund processing."""
-        # Mock random to always succeed
-        with patch('src.tools.payment.random.random', return_value=0.5):
-            input_data = RefundInput(
-                payment_id="PAY-12345",
-                customer_id="C12345",
-                amount=49.99,
-                reason="Duplicate charge",
-            )
-
-            result = await tool.execute(input_data)
-
-            assert result.success is True
-            assert result.result["success"] is True
-            assert result.result["payment_id"] == "PAY-12345"
-            assert result.result["amount"] == 49.99
-            assert result.result["status"] == "processed"
-            assert "refund_id" in result.result
-
-    @pytest.mark.asyncio
-    async def test_process_refund_failure(self, tool):
-        """Test refund processing failure."""
-        # Mock random to always fail
-        with patch('src.tools.payment.random.random', return_value=0.05):
-            input_data = RefundInput(
-                payment_id="PAY-12345",
-                customer_id="C12345",
-                amount=49.99,
-                reason="Test refund",
+    async def test_process_refund(self):
+        """Test refund processing outcomes, run concurrently."""
+        results = await asyncio.gather(
+            *(
+                PaymentTool(refund_outcomes=itertools.repeat(gateway_succeeds)).execute(input_data)
+                for gateway_succeeds, input_data, _ in REFUND_CASES
             )
+        )
 
-            result = await tool.execute(input_data)
-
-            assert result.success is True  # Tool execution succeeded
-            assert result.result["success"] is False  # Refund failed
-            assert "error" in result.result
-            assert result.result["retry_recommended"] is True
+        for (_, input_data, expected), result in zip(REFUND_CASES, results):
+            name = input_data.reason
+            assert result.success is True, name  # Tool execution succeeded
+            assert {key: result.result.get(key) for key in expected} == expected, name
+            if expected["success"]:
+                assert "refund_id" in result.result, name
+            else:
+                assert "error" in result.result, name
 
-    @pytest.mark.asyncio
-    async def test_query_payment(self, tool):
+    async def test_query_payment(self, payment_tool):
         """Test payment query."""
-        input_data = PaymentQueryInput(
-            payment_id="PAY-12345",
-            customer_id="C12345",
-        )
-
-        result = await tool.execute(input_data)
+        result = await payment_tool.execute(PAYMENT_QUERY)
 
         assert result.success is True
         assert result.result["found"] is True
@@ -74,18 +80,55 @@ class TestPaymentTool:
         assert "amount" in result.result
         assert "last4" in result.result
 
-    @pytest.mark.asyncio
-    async def test_large_refund_amount(self, tool):
-        """Test refund with large amount."""
-        with patch('src.tools.payment.random.random', return_value=0.5):
-            input_data = RefundInput(
-                payment_id="PAY-99999",
-                customer_id="C99999",
-                amount=999.99,
-                reason="Service cancellation",
-            )
+    async def test_concurrent_queries_share_one_fetch(self, payment_tool, monkeypatch):
+        """Test duplicate in-flight queries collapse into a single fetch."""
+        input_data = PaymentQueryInput(payment_id="PAY-777", customer_id="C777")
+
+        fetch_payment = payment_tool._fetch_payment
+        fetches = []
+
+        async def slow_fetch(data):
+            fetches.append(data)
+            await asyncio.sleep(0)  # let the other queries arrive mid-fetch
+            return await fetch_payment(data)
 
-            result = await tool.execute(input_data)
+        monkeypatch.setattr(payment_tool, "_fetch_payment", slow_fetch)
+        results = await asyncio.gather(*(payment_tool.execute(input_data) for _ in range(5)))
+        again = await payment_tool.execute(input_data)
 
-            assert result.success is True
-            assert result.result["amount"] == 999.99
+        assert len(fetches) == 1
+        assert all(r.result == again.result for r in results)
+        assert results[0].result is not again.result
+
+    async def test_failed_fetch_is_shared_then_retried(self, payment_tool, monkeypatch):
+        """Test concurrent queries share a failed fetch, and the next query fetches again."""
+        input_data = PaymentQueryInput(payment_id="PAY-778", customer_id="C778")
+
+        fetch_payment = payment_tool._fetch_payment
+        fetches = []
+
+        async def flaky_fetch(data):
+            fetches.append(data)
+            await asyncio.sleep(0)
+            if len(fetches) == 1:
+                raise ConnectionError("gateway unavailable")
+            return await fetch_payment(data)
+
+        monkeypatch.setattr(payment_tool, "_fetch_payment", flaky_fetch)
+        results = await asyncio.gather(*(payment_tool.execute(input_data) for _ in range(5)))
+
+        assert len(fetches) == 1
+        assert all(not r.success and r.error == "gateway unavailable" for r in results)
+
+        retry = await payment_tool.execute(input_data)
+
+        assert len(fetches) == 2
+        assert retry.success is True
+
+    async def test_unknown_operation(self, payment_tool):
+        """Test inputs without a handler are rejected."""
+        result = await payment_tool.execute(ToolInput())
+
+        assert result.success is True
+        assert result.result["success"] is False
+        assert result.result["error"] == "Unknown payment operation"
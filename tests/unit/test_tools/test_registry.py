@@ -0,0 +1,59 @@
+"""
+Unit tests for the Tool Registry.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.tools.registry import ToolRegistry
+
+
+@pytest.mark.asyncio
+class TestToolRegistryWarmup:
+    """Test suite for ToolRegistry.ensure_initialized."""
+
+    @pytest.fixture
+    def registry(self):
+        """Create a fresh ToolRegistry."""
+        return ToolRegistry()
+
+    @pytest.fixture
+    def tool(self, registry, monkeypatch):
+        """Replace the registry's tools with one whose warmup is mocked."""
+        tool = MagicMock()
+        tool.warmup = AsyncMock()
+        monkeypatch.setattr(registry, "_tools", {"fake": tool})
+        return tool
+
+    async def test_concurrent_callers_share_one_warmup(self, registry, tool):
+        """Test callers arriving during warmup wait for it instead of returning early."""
+        release = asyncio.Event()
+
+        async def slow_warmup():
+            await release.wait()
+
+        tool.warmup.side_effect = slow_warmup
+
+        callers = [asyncio.ensure_future(registry.ensure_initialized()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert not any(caller.done() for caller in callers)
+
+        release.set()
+        await asyncio.gather(*callers)
+
+        assert tool.warmup.await_count == 1
+        await registry.ensure_initialized()
+        assert tool.warmup.await_count == 1
+
+    async def test_failed_warmup_is_retried(self, registry, tool):
+        """Test a failing warmup raises and leaves the registry uninitialized."""
+        tool.warmup.side_effect = [RuntimeError("index unavailable"), None]
+
+        with pytest.raises(RuntimeError, match="index unavailable"):
+            await registry.ensure_initialized()
+
+        await registry.ensure_initialized()
+
+        assert tool.warmup.await_count == 2